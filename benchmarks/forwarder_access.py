@@ -0,0 +1,68 @@
+"""
+Microbenchmark comparing attribute and method access on a raw object, an untyped
+Forwarder and a typed (PROXY_ONTO) Forwarder.
+
+Usage: python benchmarks/forwarder_access.py [number]
+"""
+import sys
+import timeit
+
+from metaforward import Forwarder
+
+
+class Target(object):
+    class_attribute = "class_attribute"
+
+    def __init__(self):
+        self.instance_attribute = 42
+
+    @property
+    def instance_property(self):
+        return self.instance_attribute
+
+    def method(self, arg=1):
+        return arg
+
+
+class TypedForwarder(Forwarder):
+    PROXY_ONTO = Target
+
+
+class CustomForwarder(Forwarder):
+    """
+    Typed Forwarder overriding _forward, which disables direct delegation
+    """
+
+    PROXY_ONTO = Target
+
+    def _forward(self, attr):
+        return getattr(self._forward_target, attr)
+
+
+ACCESSES = {
+    "class attribute": "x.class_attribute",
+    "instance property": "x.instance_property",
+    "method call": "x.method(2)",
+}
+
+
+def main(number=1000000):
+    proxies = [
+        ("raw object", Target()),
+        ("untyped Forwarder", Forwarder(Target())),
+        ("typed Forwarder (via _forward)", CustomForwarder(Target())),
+        ("typed Forwarder", TypedForwarder(Target())),
+    ]
+    print("{:<32}".format("ns per access") + "".join("{:>20}".format(a) for a in ACCESSES))
+    for name, proxy in proxies:
+        timings = []
+        for statement in ACCESSES.values():
+            seconds = min(
+                timeit.repeat(statement, globals={"x": proxy}, number=number, repeat=3),
+            )
+            timings.append(seconds / number * 1e9)
+        print("{:<32}".format(name) + "".join("{:>20.1f}".format(t) for t in timings))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
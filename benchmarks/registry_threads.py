@@ -0,0 +1,60 @@
+"""
+Benchmark ForwarderList construction throughput across threads.
+
+"cold" constructs lists of freshly created types, so every construction has to
+generate (or wait for) a typed forwarder class; "warm" reuses types whose classes
+are already registered, so construction only reads the registry.
+
+Usage: python benchmarks/registry_threads.py [constructions_per_thread]
+"""
+import sys
+import threading
+import time
+
+from metaforward import ForwarderList, TypedForwarderListMeta
+
+
+def fresh_types(count):
+    return [type("Item{}".format(ix), (object, ), {"value": ix}) for ix in range(count)]
+
+
+def run(n_threads, per_thread, types):
+    barrier = threading.Barrier(n_threads + 1)
+    classes = [[] for _ in range(n_threads)]
+
+    def construct(seen):
+        barrier.wait()
+        for ix in range(per_thread):
+            item_type = types[ix % len(types)]
+            seen.append((item_type, type(ForwarderList([item_type()], proxy_onto=True))))
+
+    threads = [threading.Thread(target=construct, args=(seen, )) for seen in classes]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    generated = {}
+    for seen in classes:
+        for item_type, cls in seen:
+            if generated.setdefault(item_type, cls) is not cls:
+                raise AssertionError("duplicate class generated for {}".format(item_type))
+    return n_threads * per_thread / elapsed
+
+
+def main(per_thread=2000):
+    print("{:>8} {:>16} {:>16}".format("threads", "cold (lists/s)", "warm (lists/s)"))
+    for n_threads in (1, 2, 4, 8):
+        # each thread walks the same fresh types so generation contends on every key
+        cold_types = fresh_types(64)
+        cold = run(n_threads, per_thread, cold_types)
+        warm = run(n_threads, per_thread, cold_types)
+        print("{:>8} {:>16.0f} {:>16.0f}".format(n_threads, cold, warm))
+    print("registered classes: {}".format(len(TypedForwarderListMeta.TypedForwarder)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
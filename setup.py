@@ -31,6 +31,7 @@ setuptools.setup(
     install_requires=[
         'decorator~=4.4.0',
         'funcsigs~=1.0.2;  python_version ~= "2.7"',
+        'futures~=3.3.0;  python_version ~= "2.7"',
         'future~=0.17.1',
         'six~=1.13.0'
     ],
@@ -3,15 +3,39 @@ Forward attribute lookup and method calls
 """
 from future.utils import with_metaclass
 import six
+from six.moves import collections_abc, copyreg
 
+import bisect
 import collections
-from functools import wraps, update_wrapper
+import heapq
+from concurrent import futures
+from functools import partial, wraps, update_wrapper
 import itertools
 import inspect
+import io
+import keyword
+import math
+import multiprocessing
+import operator
+import re
+import struct
+import sys
+import threading
+import time
 import warnings
 
 import decorator
 
+try:
+    from multiprocessing.reduction import ForkingPickler
+except ImportError:  # Python 2
+    from multiprocessing.forking import ForkingPickler
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
 if six.PY2:
     import funcsigs
 
@@ -87,6 +111,26 @@ def method_signature_and_defaults(method):
     return MethodParametersAndDefaults(tuple(parameters), tuple(defaults))
 
 
+def call_arguments(parameters):
+    """
+    :param parameters: parameter sequence as returned by `method_signature_and_defaults`
+    :return: "a, b, *args, c=c, **kwargs" passing each parameter on by name
+    """
+    arguments = []
+    keyword_only = False
+    for param in parameters:
+        # strip default value and annotation
+        name = param.split("=", 1)[0].split(":", 1)[0].strip()
+        if name.startswith("*"):
+            keyword_only = True
+            arguments.append(name)
+        elif keyword_only:
+            arguments.append("{0}={0}".format(name))
+        else:
+            arguments.append(name)
+    return ", ".join(arguments)
+
+
 def method_forwarder(attr, method):
     """
     :param attr: the name of the attribute to forward
@@ -106,7 +150,7 @@ def method_forwarder(attr, method):
     }
     return decorator.FunctionMaker.create(
         method_def,
-        "return self._forward(attr)({})".format(", ".join(parameters[1:])),
+        "return self._forward(attr)({})".format(call_arguments(parameters[1:])),
         dict(attr=attr),
         defaults=defaults,
         doc=method_attrs.pop("__doc__", None),
@@ -129,6 +173,78 @@ def property_forwarder(attr, value):
     return property(proxy, doc=value.__doc__)
 
 
+class BoundOnceMethod(object):
+    """
+    Non-data descriptor forwarding a method onto the `_forward_target` of a Forwarder.
+
+    The target's bound method is looked up on first access and stored in the instance
+    __dict__, so later accesses are plain instance attribute lookups. Accessed on the
+    class, the signature-preserving `method_forwarder` proxy is returned instead.
+    """
+
+    def __init__(self, name, attr, proxy):
+        """
+        :param name: the name of this descriptor on the Forwarder class
+        :param attr: the name of the method to forward
+        :param proxy: the `method_forwarder` proxy for attr
+        """
+        self.name = name
+        self.attr = attr
+        self.proxy = proxy
+        self.__doc__ = proxy.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.proxy
+        bound = getattr(instance._forward_target, self.attr)
+        instance.__dict__[self.name] = bound
+        return bound
+
+
+def specialized_forwarder(attr, proxy):
+    """
+    :param attr: the name of the attribute to forward
+    :param proxy: the property forwarding attr
+    :return: a property forwarding attr unless an instance attribute of the same name
+             was assigned, which is stored in (and read from) the instance __dict__ as
+             it would be without the property
+    """
+
+    def fget(self):
+        try:
+            return self.__dict__[attr]
+        except KeyError:
+            return proxy.__get__(self, type(self))
+
+    def fset(self, value):
+        self.__dict__[attr] = value
+
+    def fdel(self):
+        try:
+            del self.__dict__[attr]
+        except KeyError:
+            raise AttributeError(attr)
+
+    return property(fget, fset, fdel, doc=proxy.__doc__)
+
+
+def direct_forwarder(name, attr, proxy):
+    """
+    :param name: the name of the forwarder on the Forwarder class
+    :param attr: the name of the attribute to forward
+    :param proxy: the forwarder returned by `forwarder` for attr
+    :return: a descriptor delegating straight to `_forward_target`, bypassing
+             `Forwarder._forward`
+    """
+    if isinstance(proxy, property):
+        return property(
+            operator.attrgetter("_forward_target.{}".format(attr)),
+            # don't inherit the attrgetter docstring
+            doc=proxy.__doc__ or "",
+        )
+    return BoundOnceMethod(name, attr, proxy)
+
+
 def forwarder(attr, value):
     """
     Convenience wrapper returns either a `method_forwarder` or a `property_forwarder`
@@ -139,6 +255,245 @@ def forwarder(attr, value):
     return property_forwarder(attr, value)
 
 
+# lookup suffixes accepted by ForwarderList.where, e.g. `identifier__gt=0.5`
+WHERE_OPERATORS = {
+    "exact": "{} == {}",
+    "ne": "{} != {}",
+    "lt": "{} < {}",
+    "lte": "{} <= {}",
+    "gt": "{} > {}",
+    "gte": "{} >= {}",
+    "in": "{} in {}",
+    "contains": "{1} in {0}",
+    "is": "{} is {}",
+    "isnot": "{} is not {}",
+}
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def parse_where_lookups(lookups):
+    """
+    :param lookups: dict of {"attribute__operator": value} as passed to `where`
+    :return: tuple of (tuple of (attribute, operator), tuple of values)
+    """
+    parsed = []
+    values = []
+    for lookup in sorted(lookups):
+        attr, _, lookup_op = lookup.rpartition("__")
+        if not attr or lookup_op not in WHERE_OPERATORS:
+            attr, lookup_op = lookup, "exact"
+        parsed.append((attr, lookup_op))
+        values.append(lookups[lookup])
+    return tuple(parsed), tuple(values)
+
+
+def where_predicate(parsed_lookups):
+    """
+    :param parsed_lookups: tuple of (attribute, operator) as returned by
+                           `parse_where_lookups`
+    :return: function(items, *values) returning a list of the items matching all
+             lookups, compiled into a single list comprehension
+    """
+    conditions = []
+    values = []
+    for ix, (attr, lookup_op) in enumerate(parsed_lookups):
+        if _IDENTIFIER.match(attr) and not keyword.iskeyword(attr):
+            item_attr = "item.{}".format(attr)
+        else:
+            item_attr = "getattr(item, {!r})".format(attr)
+        value = "v{}".format(ix)
+        conditions.append(WHERE_OPERATORS[lookup_op].format(item_attr, value))
+        values.append(value)
+    return decorator.FunctionMaker.create(
+        "where({})".format(", ".join(["items"] + values)),
+        "return [item for item in items if {}]".format(" and ".join(conditions) or True),
+        {},
+    )
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ("hits", "misses", "maxsize", "currsize"),
+)
+
+# sentinel returned by ForwarderCache.get when a result is not cached
+_MISSING = object()
+
+
+class ForwarderCache(object):
+    """
+    Size-bounded LRU cache of forwarded results keyed by the identity of the item the
+    result was forwarded from, the attribute name and the (hashable) call arguments.
+
+    Each entry holds a reference to its item, so the `id()` used in the key cannot be
+    reused by a different object while the entry is cached.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        :param maxsize: maximum number of cached results (None for unbounded)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, item, attr, args_key=None):
+        """
+        :param item: the item the result was forwarded from
+        :param attr: name of the forwarded attribute
+        :param args_key: hashable call arguments, None for attribute reads
+        :return: the cached result or _MISSING
+        :raises: TypeError if args_key is not hashable
+        """
+        key = (id(item), attr, args_key)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return _MISSING
+            # re-insert to mark as most recently used
+            self._entries[key] = entry
+            self.hits += 1
+        return entry[1]
+
+    def put(self, item, attr, args_key, value):
+        """
+        Store a freshly computed result, evicting the least recently used results
+        when the cache is full.
+
+        :param item: the item the result was forwarded from
+        :param attr: name of the forwarded attribute
+        :param args_key: hashable call arguments, None for attribute reads
+        :param value: the forwarded result
+        """
+        with self._lock:
+            self.misses += 1
+            self._entries[(id(item), attr, args_key)] = (item, value)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, items=None, attrs=None):
+        """
+        Drop cached results.
+
+        :param items: only drop results forwarded from these items
+        :param attrs: only drop results for these attribute names
+        :return: the number of dropped results
+        """
+        item_ids = None if items is None else {id(item) for item in items}
+        attrs = None if attrs is None else set(attrs)
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if (item_ids is None or key[0] in item_ids)
+                and (attrs is None or key[1] in attrs)
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        """
+        Drop all cached results and reset the statistics
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        """
+        :rtype: CacheInfo
+        :return: hit/miss statistics and current size of the cache
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+def memoized_method(cache, item, attr, method):
+    """
+    :param cache: ForwarderCache to store results in
+    :param item: the item `method` is bound to
+    :param attr: the name of the forwarded method
+    :param method: the bound method being forwarded
+    :return: a callable that caches the result of `method` for hashable arguments
+    """
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        args_key = (args, tuple(sorted(kwargs.items())))
+        try:
+            value = cache.get(item, attr, args_key)
+        except TypeError:
+            # unhashable arguments are never cached
+            return method(*args, **kwargs)
+        if value is _MISSING:
+            value = method(*args, **kwargs)
+            cache.put(item, attr, args_key, value)
+        return value
+
+    return wrapper
+
+
+def memoized_attribute(cache, item, attr):
+    """
+    :param cache: ForwarderCache to store results in
+    :param item: the item to look up `attr` on
+    :param attr: the name of the forwarded attribute
+    :return: the (possibly cached) attribute value, or a memoized_method if the
+             attribute is callable
+    """
+    value = cache.get(item, attr)
+    if value is _MISSING:
+        value = getattr(item, attr)
+        if callable(value):
+            return memoized_method(cache, item, attr, value)
+        cache.put(item, attr, None, value)
+    return value
+
+
+class ForwarderRegistry(dict):
+    """
+    dict of generated classes or forwarder tables that is safe to populate from many
+    threads at once.
+
+    Reads are plain dict lookups and never take a lock. On a miss, the value for a
+    key is generated exactly once: concurrent callers asking for the same key wait for
+    the first one, while other keys are generated in parallel.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        :param args: passed on to dict
+        :param kwargs: passed on to dict
+        """
+        super(ForwarderRegistry, self).__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def get_or_generate(self, key, generate):
+        """
+        :param key: registry key
+        :param generate: callable returning the value for key, called at most once
+                         per key
+        :return: the registered value for key
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key)
+            if value is None:
+                value = self.setdefault(key, generate())
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return value
+
+
 class TypedForwarderMeta(type):
     """
     Warning: grey Magic ahead
@@ -158,13 +513,22 @@ class TypedForwarderMeta(type):
     AttributeError in heterogeneous lists.
     """
 
-    # Autogenerated Forwarder subclasses are stored here. Keys are returned
-    # by the `_typed_key` staticmethod
-    TypedForwarder = {}
+    # Autogenerated Forwarder subclasses are stored here. Keys are the
+    # (forwarder class, proxied type) pairs returned by the `_typed_key` staticmethod
+    TypedForwarder = ForwarderRegistry()
+    # Forwarder methods and properties generated for each proxied type, shared by all
+    # Forwarder base classes
+    ForwarderTables = ForwarderRegistry()
     # Forwarder subclasses may specify the proxy type statically at define time
     PROXY_ONTO_TAG = "PROXY_ONTO"
     # Forwarder subclasses may explicitly ignore attributes on proxied types
     IGNORED_ATTRIBUTES_TAG = "IGNORED_ATTRIBUTES"
+    # Forwarder subclasses may set the number of lookups of a dynamic attribute after
+    # which a forwarding property is installed for it on the class (None to disable)
+    SPECIALIZE_THRESHOLD_TAG = "SPECIALIZE_THRESHOLD"
+    DEFAULT_SPECIALIZE_THRESHOLD = 16
+    # Dynamically generated Forwarder subclasses reference their base class here
+    FORWARDER_BASE_TAG = "_forwarder_base"
 
     @classmethod
     def ignored_attributes_from_bases(mcs, bases, dct=None):
@@ -218,7 +582,7 @@ class TypedForwarderMeta(type):
 
     @staticmethod
     def _typed_key(forwarder_cls, proxy_onto_type):
-        return "{}__{}".format(forwarder_cls.__name__, proxy_onto_type.__name__)
+        return forwarder_cls, proxy_onto_type
 
     @staticmethod
     def _orig_base(name, bases):
@@ -240,6 +604,21 @@ class TypedForwarderMeta(type):
                 ),
             )
 
+    @staticmethod
+    def _delegates_directly(forwarder_cls, dct=None):
+        """
+        :param forwarder_cls: Base class for the new Forwarder subclass
+        :param dct: optional dict of attributes for a class under construction
+        :return: True if forwarder_cls forwards onto its single `_forward_target` with
+                 the default `Forwarder._forward`, so that generated forwarders may
+                 delegate to the target directly
+        """
+        if dct is not None and "_forward" in dct:
+            return False
+        return six.get_unbound_function(forwarder_cls._forward) is (
+            six.get_unbound_function(Forwarder._forward)
+        )
+
     @staticmethod
     def _common_type_from_sequence(seq):
         """
@@ -253,8 +632,23 @@ class TypedForwarderMeta(type):
             warnings.warn("Cannot determine proxy_onto type from an empty sequence")
             return object
 
+    @classmethod
+    def _forward_proxy_for(mcs, proxy_onto_type):
+        """
+        Get the forwarder methods for `proxy_onto_type` from ForwarderTables, generating
+        them on first use. The proxied type is only introspected once, however many
+        Forwarder classes proxy onto it.
+
+        :param proxy_onto_type: The object type to proxy attribute and method access for
+        :return: dict of {attribute: proxied_method_or_property}, shared between all
+                 callers and must not be modified
+        """
+        return mcs.ForwarderTables.get_or_generate(
+            proxy_onto_type, lambda: mcs._generate_forward_proxies(proxy_onto_type),
+        )
+
     @staticmethod
-    def _forward_proxy_for(proxy_onto_type):
+    def _generate_forward_proxies(proxy_onto_type):
         """
         Create a list of forwarder methods for forwarding attribute and method access
         from a Forwarder to a sequence of `proxy_onto_type` objects.
@@ -282,26 +676,66 @@ class TypedForwarderMeta(type):
         )
         return {k: v for k, v in wrapped.items() if v is not None}
 
-    @staticmethod
-    def _generate_warn_getattr(real_getattr, proxy_onto_type):
+    @classmethod
+    def _generate_warn_getattr(mcs, real_getattr, proxy_onto_type, delegate_directly=False):
         """
         :param real_getattr: Reference to the parent class __getattr__ method
         :param proxy_onto_type: The object type to proxy attribute and method access for
-        :return: __getattr__ method that raises a warning when the attribute is not
-                explicitly defined (but still forwards lookup anyway)
+        :param delegate_directly: If True, specialized attributes delegate directly to
+                the `_forward_target` (see `_delegates_directly`)
+        :return: __getattr__ method that raises a warning the first time an attribute
+                that is not explicitly defined is looked up on a class (but still
+                forwards lookup anyway). Once an attribute has been looked up
+                SPECIALIZE_THRESHOLD times on a class, a forwarding property is
+                installed for it on that class (see `specialized_forwarder`).
         """
+        # keyed by (class, attribute), as subclasses inherit this __getattr__
+        misses = {}
 
         def __getattr__(self, attr):
             result = real_getattr(self, attr)
-            warnings.warn(
-                "{!r} is not a forwarded attribute of {!r} ({!r})".format(
-                    attr, proxy_onto_type, self,
-                ),
+            key = (type(self), attr)
+            count = misses[key] = misses.get(key, 0) + 1
+            if count == 1:
+                warnings.warn(
+                    "{!r} is not a forwarded attribute of {!r} ({!r})".format(
+                        attr, proxy_onto_type, self,
+                    ),
+                )
+            threshold = getattr(
+                type(self), mcs.SPECIALIZE_THRESHOLD_TAG, mcs.DEFAULT_SPECIALIZE_THRESHOLD,
             )
+            if threshold is not None and count >= threshold and not attr.startswith("__"):
+                proxy = property_forwarder(attr, None)
+                if delegate_directly:
+                    proxy = direct_forwarder(attr, attr, proxy)
+                setattr(type(self), attr, specialized_forwarder(attr, proxy))
+                misses.pop(key, None)
             return result
 
         return __getattr__
 
+    @staticmethod
+    def _generate_rebind_setattr(real_setattr):
+        """
+        :param real_setattr: Reference to the parent class __setattr__ method
+        :return: __setattr__ method that drops the bound methods cached by
+                 BoundOnceMethod descriptors when `_forward_target` is reassigned
+        """
+        def __setattr__(self, attr, value):
+            real_setattr(self, attr, value)
+            if attr != "_forward_target":
+                return
+            mro = inspect.getmro(type(self))
+            for name in list(self.__dict__):
+                for cls in mro:
+                    if name in cls.__dict__:
+                        if isinstance(cls.__dict__[name], BoundOnceMethod):
+                            del self.__dict__[name]
+                        break
+
+        return __setattr__
+
     @classmethod
     def _generate_subclass_attributes(
         mcs,
@@ -309,6 +743,7 @@ class TypedForwarderMeta(type):
         proxy_onto_type,
         shadowed_attributes=None,
         ignored_attributes=None,
+        delegate_directly=None,
     ):
         """
         :param forwarder_cls: Base class for the new Forwarder subclass
@@ -316,27 +751,44 @@ class TypedForwarderMeta(type):
         :param ignored_attributes: Optional set of attributes to not forward. If not
                 specified will default to all defined and explicitly IGNORED attributes
                 of forwarder_cls and parent classes
+        :param delegate_directly: If True, generate forwarders that bypass `_forward`
+                (see `_delegates_directly`, which is used if not specified)
         :return: dict of attributes for a new Forwarder class
         """
         if ignored_attributes is None:
             ignored_attributes = mcs.ignored_attributes_from_cls(forwarder_cls)
         if shadowed_attributes is None:
             shadowed_attributes = mcs.shadowed_attributes_from_cls(forwarder_cls)
+        if delegate_directly is None:
+            delegate_directly = mcs._delegates_directly(forwarder_cls)
+        if delegate_directly:
+            wrap = direct_forwarder
+        else:
+            def wrap(name, attr, proxy):
+                return proxy
         proxies = mcs._forward_proxy_for(proxy_onto_type)
         new_attributes = {
-            a: v
+            a: wrap(a, a, v)
             for a, v in proxies.items()
             if a not in ignored_attributes.union(shadowed_attributes)
         }
         # if the Forwarder shadows attributes from the target object, those can be
         # called with a trailing underscore
         new_attributes.update(
-            {a + "_": v for a, v in proxies.items() if a in shadowed_attributes},
+            {
+                a + "_": wrap(a + "_", a, v)
+                for a, v in proxies.items()
+                if a in shadowed_attributes
+            },
         )
         new_attributes[mcs.PROXY_ONTO_TAG] = proxy_onto_type
         new_attributes["__getattr__"] = mcs._generate_warn_getattr(
-            forwarder_cls.__getattr__, proxy_onto_type,
+            forwarder_cls.__getattr__, proxy_onto_type, delegate_directly,
         )
+        if delegate_directly:
+            new_attributes["__setattr__"] = mcs._generate_rebind_setattr(
+                forwarder_cls.__setattr__,
+            )
         return new_attributes
 
     @classmethod
@@ -352,11 +804,10 @@ class TypedForwarderMeta(type):
             # no type specialization for object
             return forwarder_cls
         name = "Typed{}For{}".format(forwarder_cls.__name__, proxy_onto_type.__name__)
-        return type(
-            name,
-            (forwarder_cls,),
-            cls._generate_subclass_attributes(forwarder_cls, proxy_onto_type),
-        )
+        attributes = cls._generate_subclass_attributes(forwarder_cls, proxy_onto_type)
+        # remember the base class so instances can be re-typed later on
+        attributes[cls.FORWARDER_BASE_TAG] = forwarder_cls
+        return type(name, (forwarder_cls,), attributes)
 
     @classmethod
     def _typecheck_proxy_onto(mcs, forwarder_cls, proxy_onto_type):
@@ -388,24 +839,32 @@ class TypedForwarderMeta(type):
         `proxy_onto`, to create statically defined subclasses of Forwarder to proxy
         attribute and method access onto a specific type.
 
-        If a subclass doesn't specify PROXY_ONTO, then this method is essentially a no-op.
+        If a subclass doesn't specify PROXY_ONTO, or is dynamically generated by
+        `_generate_typed_forwarder` (which already added the forwarders), then this
+        method is essentially a no-op.
 
         :param name: The name of the class being created
         :param bases: The parents of the class being created
         :param dct: The attributes of the class being created
         """
         proxy_onto = dct.get(mcs.PROXY_ONTO_TAG, None)
-        if proxy_onto:
+        if proxy_onto and mcs.FORWARDER_BASE_TAG not in dct:
             orig_base = mcs._orig_base(name, bases)
             mcs._typecheck_proxy_onto(orig_base, proxy_onto)
+            delegate_directly = mcs._delegates_directly(orig_base, dct)
+            class_setattr = dct.get("__setattr__")
             dct.update(
                 mcs._generate_subclass_attributes(
                     forwarder_cls=orig_base,
                     proxy_onto_type=proxy_onto,
                     shadowed_attributes=mcs.shadowed_attributes_from_bases(bases, dct),
                     ignored_attributes=mcs.ignored_attributes_from_bases(bases, dct),
+                    delegate_directly=delegate_directly,
                 ),
             )
+            if delegate_directly and class_setattr is not None:
+                # keep the __setattr__ defined in the class body
+                dct["__setattr__"] = mcs._generate_rebind_setattr(class_setattr)
         return super(TypedForwarderMeta, mcs).__new__(mcs, name, bases, dct)
 
 
@@ -456,11 +915,7 @@ class Forwarder(with_metaclass(TypedForwarderMeta)):
         return self._forward("__enter__")()
 
     def __exit__(self, etype, evalue, traceback):
-        suppress_exception = False
-        for ex in self._forward_attribute("__exit__"):
-            if ex(etype, evalue, traceback):
-                suppress_exception = True
-        return suppress_exception
+        return self._forward("__exit__")(etype, evalue, traceback)
 
 
 class TypedForwarderListMeta(TypedForwarderMeta):
@@ -473,6 +928,11 @@ class TypedForwarderListMeta(TypedForwarderMeta):
     # ForwarderList subclasses may specify True to automatically register themselves as
     # the handler for their type in all parent ForwarderList classes
     DEFAULT_PROXY_TAG = "DEFAULT_PROXY"
+    # MemoizingForwarderList subclasses may specify True or a sequence of attribute
+    # names to cache per-item results for
+    MEMOIZE_TAG = "MEMOIZE"
+    # MemoizingForwarderList subclasses may bound the size of their result cache
+    MEMOIZE_MAXSIZE_TAG = "MEMOIZE_MAXSIZE"
 
     def __call__(cls, iterable, *args, **kwargs):
         """
@@ -495,23 +955,32 @@ class TypedForwarderListMeta(TypedForwarderMeta):
         proxy_onto = kwargs.get("proxy_onto", None)
         if proxy_onto is True:
             # Collapse the iterable to get the common type of the sequence
-            if not isinstance(iterable, collections.Sequence):
+            if not isinstance(iterable, collections_abc.Sequence):
                 # if we have an iterator, make sure to save the values to later
                 # instantiate the list!
                 iterable = tuple(iterable)
             proxy_onto = cls._common_type_from_sequence(iterable)
         if proxy_onto:
-            cls._typecheck_proxy_onto(forwarder_cls, proxy_onto)
-            forwarder_cls = cls.TypedForwarder.setdefault(
-                cls._typed_key(forwarder_cls, proxy_onto),
-                cls._generate_typed_forwarder(
-                    forwarder_cls=forwarder_cls, proxy_onto_type=proxy_onto,
-                ),
-            )
+            forwarder_cls = cls._typed_forwarder_cls(proxy_onto)
         return super(TypedForwarderListMeta, forwarder_cls).__call__(
             iterable, *args, **kwargs
         )
 
+    def _typed_forwarder_cls(cls, proxy_onto):
+        """
+        :param proxy_onto: The object type to proxy attribute and method access for
+        :return: the registered Forwarder subclass of cls specialized for proxy_onto
+        :raises: TypeError if proxy_onto is not a type or not subclass of the
+                 cls' PROXY_ONTO type
+        """
+        cls._typecheck_proxy_onto(cls, proxy_onto)
+        return cls.TypedForwarder.get_or_generate(
+            cls._typed_key(cls, proxy_onto),
+            lambda: cls._generate_typed_forwarder(
+                forwarder_cls=cls, proxy_onto_type=proxy_onto,
+            ),
+        )
+
     def __new__(mcs, name, bases, dct):
         """
         Called when creating subclasses of ForwarderList.
@@ -519,8 +988,18 @@ class TypedForwarderListMeta(TypedForwarderMeta):
         Handles the class attribute DEFAULT_PROXY, which registers this subclass as
         the default handler for it's proxied type when creating a new ForwarderList
         containing that subtype
+
+        Classes declaring MEMOIZE or MEMOIZE_MAXSIZE get their own result cache, which
+        is shared with subclasses (including dynamically typed ones) that don't.
+        MEMOIZE is normalized to True or a frozenset of attribute names (a single
+        string names one attribute).
         """
         proxy_onto = dct.get(mcs.PROXY_ONTO_TAG, None)
+        memoize = dct.get(mcs.MEMOIZE_TAG, True)
+        if memoize is not True:
+            if isinstance(memoize, six.string_types):
+                memoize = (memoize,)
+            dct[mcs.MEMOIZE_TAG] = frozenset(memoize or ())
         # pop DEFAULT_PROXY so that subclasses don't inherit it
         default_proxy = dct.pop(mcs.DEFAULT_PROXY_TAG, False)
         new_class = super(TypedForwarderListMeta, mcs).__new__(mcs, name, bases, dct)
@@ -528,138 +1007,1006 @@ class TypedForwarderListMeta(TypedForwarderMeta):
             for cls in bases + (new_class,):
                 if isinstance(cls, mcs):
                     mcs.TypedForwarder[mcs._typed_key(cls, proxy_onto)] = new_class
+        if mcs.MEMOIZE_TAG in dct or mcs.MEMOIZE_MAXSIZE_TAG in dct:
+            new_class._memo_cache = ForwarderCache(
+                maxsize=getattr(new_class, mcs.MEMOIZE_MAXSIZE_TAG, None),
+            )
         return new_class
 
 
-class ForwarderList(with_metaclass(TypedForwarderListMeta, list, Forwarder)):
+def typed_forwarder_cls(forwarder_cls, proxy_onto_type):
     """
-    Forward arbitrary attribute access on the list to each item of the list
-    and return a ForwarderList containing the results.
+    Unpickle helper for dynamically generated Forwarder subclasses
+
+    :param forwarder_cls: Base class of the typed Forwarder subclass
+    :param proxy_onto_type: The object type to proxy attribute and method access for
+    :return: the registered Forwarder subclass of forwarder_cls for proxy_onto_type
     """
+    return forwarder_cls._typed_forwarder_cls(proxy_onto_type)
 
-    def __init__(self, iterable, proxy_onto=None):
-        """
-        :param iterable: The iterable to seed the IterList with
-        :param proxy_onto: The class of objects in the list -- This is interpreted by
-               the TypedForwarderMeta class
-        """
-        super(ForwarderList, self).__init__(iterable)
-        self.proxy_onto = (
-            proxy_onto
-            if proxy_onto
-            else getattr(self, TypedForwarderMeta.PROXY_ONTO_TAG, None)
-        )
 
-    def _forward_attribute(self, attr):
-        return [getattr(x, attr) for x in self]
+def reduce_forwarder_cls(cls):
+    """
+    Pickle dynamically generated Forwarder subclasses as their base class and proxied
+    type, so they are looked up in (or regenerated into) the registry when unpickled.
 
-    def _forward_method(self, methods):
-        def wrapper(*args, **kwargs):
-            return ForwarderList(
-                [m(*args, **kwargs) for m in methods], proxy_onto=bool(self.proxy_onto),
-            )
+    :param cls: Forwarder class being pickled
+    :return: reduce value for pickle
+    """
+    forwarder_base = cls.__dict__.get(TypedForwarderMeta.FORWARDER_BASE_TAG)
+    if forwarder_base is None:
+        # classes defined in code are pickled by reference
+        return getattr(cls, "__qualname__", cls.__name__)
+    return (
+        typed_forwarder_cls,
+        (forwarder_base, getattr(cls, TypedForwarderMeta.PROXY_ONTO_TAG)),
+    )
 
-        if methods:
-            wrapper = update_wrapper(wrapper, methods[0])
 
-        return wrapper
+copyreg.pickle(TypedForwarderMeta, reduce_forwarder_cls)
+copyreg.pickle(TypedForwarderListMeta, reduce_forwarder_cls)
 
-    def _forward(self, attr):
+
+# compiled `where` predicates keyed by (proxied type, parsed lookups)
+_where_predicates = ForwarderRegistry()
+
+
+class ForwarderIndex(object):
+    """
+    Hash index (and optionally sorted index) of the items of a ForwarderList by the
+    value of a forwarded attribute.
+
+    Lookups return selections of the same (typed) class as the indexed list. The index
+    is updated in place when items are appended to the list and lazily rebuilt on the
+    next lookup after any other mutation.
+    """
+
+    def __init__(self, forwarder_list, attr, ordered=False):
         """
-        Forward attribute lookup for `attr` onto each element of the list.
+        :param forwarder_list: the ForwarderList to index
+        :param attr: name of the forwarded attribute to index items by
+        :param ordered: if True, also maintain a sorted index for `range` queries
+        """
+        self.forwarder_list = forwarder_list
+        self.attr = attr
+        self.ordered = ordered
+        self._buckets = None
+        self._sorted_keys = None
+        self._sorted_items = None
+
+    def _build_buckets(self):
+        buckets = {}
+        for item in self.forwarder_list:
+            buckets.setdefault(getattr(item, self.attr), []).append(item)
+        self._buckets = buckets
+        return buckets
+
+    def _build_sorted(self):
+        items = list(self.forwarder_list)
+        keys = [getattr(item, self.attr) for item in items]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._sorted_keys = [keys[ix] for ix in order]
+        self._sorted_items = [items[ix] for ix in order]
+
+    def _append(self, items):
+        """
+        Add items appended to the end of the indexed list
 
-        :param attr: name of the attribute to forward
-        :return: ForwarderList wrapping the result for non-callable attributes or
-                 Arbitrary callable returning a ForwarderList wrapping the result of
-                 calling the underlying method
+        :param items: sequence of appended items
         """
-        results = self._forward_attribute(attr)
-        if results and all([callable(r) for r in results]):
-            return self._forward_method(results)
-        if results:
-            # Normal case, return a ForwarderList with the results
-            return ForwarderList(results, proxy_onto=bool(self.proxy_onto))
-        # Empty list
-        return results
+        if self._buckets is not None:
+            for item in items:
+                self._buckets.setdefault(getattr(item, self.attr), []).append(item)
+        self._sorted_keys = self._sorted_items = None
 
-    def _scatter_method(self, methods):
+    def invalidate(self):
         """
-        Scatter iterables across forwarded method call
+        Discard the index, it will be rebuilt on the next lookup
+        """
+        self._buckets = self._sorted_keys = self._sorted_items = None
 
-        :param methods: sequence of bound methods
-        :return:
+    def __getitem__(self, key):
+        """
+        :param key: attribute value to select items by
+        :return: ForwarderList of all items whose attribute equals `key` (in list order)
         """
+        buckets = self._buckets if self._buckets is not None else self._build_buckets()
+        return self.forwarder_list._new_like(buckets.get(key, ()))
 
-        def iterable_arg(a):
-            if isinstance(a, six.string_types):
-                return itertools.cycle((a,))
-            try:
-                return itertools.cycle(a)
-            except TypeError:
-                return itertools.cycle((a,))
+    def __contains__(self, key):
+        buckets = self._buckets if self._buckets is not None else self._build_buckets()
+        return key in buckets
 
-        def iterable_kwarg(k, v):
-            if k.endswith("__"):
-                # double underscore isn't escaped
-                return k[:-1], iterable_arg(v)
-            if k.endswith("_"):
-                return k[:-1], itertools.cycle((v,))
-            return k, iterable_arg(v)
+    def __len__(self):
+        buckets = self._buckets if self._buckets is not None else self._build_buckets()
+        return len(buckets)
 
-        if not all([callable(m) for m in methods]):
-            raise RuntimeError(
-                "Cannot scatter onto non-callable attribute {!r}".format(
-                    [m for m in methods if not callable(m)],
-                ),
-            )
+    def keys(self):
+        """
+        :return: list of distinct attribute values
+        """
+        buckets = self._buckets if self._buckets is not None else self._build_buckets()
+        return list(buckets)
 
-        def wrapper(*args, **kwargs):
-            argset = [iterable_arg(a) for a in args]
-            arggen = (tuple(next(ai) for ai in argset) for _ in methods)
-            kwargset = dict(iterable_kwarg(k, v) for k, v in kwargs.items())
-            kwarggen = ({k: next(v) for k, v in kwargset.items()} for _ in methods)
-            return ForwarderList(
-                [
-                    m(*iterargs, **iterkwargs)
-                    for m, iterargs, iterkwargs in zip(methods, arggen, kwarggen)
-                ],
-                proxy_onto=bool(self.proxy_onto),
+    def range(self, start=None, stop=None):
+        """
+        :param start: smallest attribute value to select (inclusive), None for no bound
+        :param stop: largest attribute value to select (exclusive), None for no bound
+        :return: ForwarderList of the selected items, ordered by attribute value
+        :raises: TypeError if the index is not ordered
+        """
+        if not self.ordered:
+            raise TypeError(
+                "range queries require an ordered index, "
+                "use index_by({!r}, ordered=True)".format(self.attr),
             )
+        if self._sorted_keys is None:
+            self._build_sorted()
+        low = 0 if start is None else bisect.bisect_left(self._sorted_keys, start)
+        high = (
+            len(self._sorted_keys)
+            if stop is None
+            else bisect.bisect_left(self._sorted_keys, stop)
+        )
+        return self.forwarder_list._new_like(self._sorted_items[low:high])
 
-        if methods:
-            wrapper = update_wrapper(wrapper, methods[0])
-        return wrapper
 
-    @property
-    def scatter(self):
+class ConcurrentForwarderContext(object):
+    """
+    Context manager entering and exiting every item of a ForwarderList concurrently.
+
+    Items are entered in parallel on a bounded thread pool. If any item fails to
+    enter, the items that were entered are exited concurrently with the exception
+    info, and the first exception is re-raised. On exit, all items are exited in
+    parallel (in no particular order), and the exception is suppressed if any item's
+    `__exit__` returns True.
+    """
+
+    def __init__(self, forwarder_list, max_workers=None):
         """
-        Get a copy of the current ForwarderList that forwards iterable arguments to
-        method calls across the elements of the list.
+        :param forwarder_list: ForwarderList of context managers
+        :param max_workers: size of the thread pool (default: executor default)
         """
-        scatter_forwarder = type(self)(self)
-        scatter_forwarder._forward_method = scatter_forwarder._scatter_method
-        return scatter_forwarder
+        self.forwarder_list = forwarder_list
+        self.max_workers = max_workers
+        self._entered = []
 
-    def __getitem__(self, item):
+    def _map(self, method, items, *args):
         """
-        Override __getitem__ to return a base ForwarderList for the slice.
+        Call `method` on each item in parallel and wait for all calls to finish.
 
-        This is a way to convert a ReducingForwarderList into a regular ForwarderList.
+        :param method: name of the context manager method to call
+        :param items: items to call the method on
+        :param args: arguments passed to each call
+        :return: tuple of (results of the successful calls, items they were called
+                 on, exc_info of the first failed call or None)
+        """
+        if not items:
+            return [], [], None
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            calls = [pool.submit(getattr(type(x), method), x, *args) for x in items]
+        results, succeeded, exc_info = [], [], None
+        for item, call in zip(items, calls):
+            try:
+                results.append(call.result())
+            except BaseException:
+                if exc_info is None:
+                    exc_info = sys.exc_info()
+            else:
+                succeeded.append(item)
+        return results, succeeded, exc_info
+
+    def _exit_all(self, etype, evalue, traceback):
+        entered, self._entered = self._entered, []
+        results, _, exc_info = self._map("__exit__", entered, etype, evalue, traceback)
+        if exc_info is not None:
+            six.reraise(*exc_info)
+        return any(results)
 
-        Any default ForwarderList subclass however will be used instead of the
-        base ForwarderList class if proxy_onto is specified
+    def __enter__(self):
         """
-        selection = super(ForwarderList, self).__getitem__(item)
-        if isinstance(item, slice):
-            return ForwarderList(selection, proxy_onto=bool(self.proxy_onto))
-        return selection
+        :return: ForwarderList of the values returned by each item's `__enter__`
+        """
+        results, self._entered, exc_info = self._map("__enter__", list(self.forwarder_list))
+        if exc_info is not None:
+            try:
+                self._exit_all(*exc_info)
+            finally:
+                six.reraise(*exc_info)
+        return self.forwarder_list._wrap_results(results)
 
+    def __exit__(self, etype, evalue, traceback):
+        return self._exit_all(etype, evalue, traceback)
 
-class ReducingForwarderList(ForwarderList):
-    """
-    A ForwarderList that returns a bare item rather than a ForwarderList if the length
-    of the resulting list is 1
-    """
+
+# dispatch strategies chosen by ExecutionPlanner
+SERIAL = "serial"
+THREAD = "thread"
+PROCESS = "process"
+
+ExecutionPlan = collections.namedtuple("ExecutionPlan", ("strategy", "workers", "chunksize"))
+ExecutionStats = collections.namedtuple(
+    "ExecutionStats",
+    (
+        "calls", "items", "total_time", "item_wall", "item_cpu", "speedup",
+        "releases_gil", "plan",
+    ),
+)
+
+_wall_time = getattr(time, "perf_counter", time.time)
+# CPU time of the calling thread, or of the process on Python < 3.7
+_cpu_time = (
+    getattr(time, "thread_time", None) or getattr(time, "process_time", None) or time.clock
+)
+
+
+def _call_chunk(calls):
+    """
+    Pool task running a chunk of forwarded method calls
+
+    :param calls: sequence of (bound method, args, kwargs)
+    :return: list of results
+    """
+    return [method(*args, **kwargs) for method, args, kwargs in calls]
+
+
+class ExecutionPlanner(object):
+    """
+    Choose serial, thread pool or process pool dispatch for each forwarded method.
+
+    The first call of a method runs serially and measures the wall and CPU time per
+    item. Methods cheaper than `min_item_time` per item stay serial. Otherwise the
+    next call runs on the thread pool: if it is at least `min_speedup` times faster
+    than the serial estimate, the method releases the GIL in practice (I/O, sleeping
+    or native code) and keeps using threads. Methods that hold the GIL use the process
+    pool if `processes` is enabled, they cost at least `process_item_time` per item,
+    and the bound methods and arguments can be pickled. Otherwise they stay serial.
+
+    Process dispatch runs methods on copies of the items, so side effects on the
+    items are lost. It is therefore only used when `processes=True`. Every call is
+    checked to be picklable first, and runs serially if any item or argument isn't.
+
+    Chunk sizes are chosen so each pool task runs for about `task_time` seconds,
+    while keeping a few tasks per worker for load balancing.
+
+    Plans and timing statistics are keyed by the qualified method name, and can be
+    inspected through `plans` and `stats`. The planner owns its pools; call
+    `shutdown` (or use it as a context manager) to release them.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers=None,
+        processes=False,
+        min_item_time=1e-4,
+        process_item_time=1e-3,
+        min_speedup=1.5,
+        task_time=5e-3,
+    ):
+        """
+        :param max_workers: size of the thread and process pools (default: CPU count)
+        :param processes: allow process pool dispatch
+        :param min_item_time: per-item seconds below which methods stay serial
+        :param process_item_time: per-item seconds required for process dispatch
+        :param min_speedup: thread pool speedup over serial dispatch required to
+                            treat a method as releasing the GIL
+        :param task_time: target seconds per pool task, used to size chunks
+        """
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.processes = processes
+        self.min_item_time = min_item_time
+        self.process_item_time = process_item_time
+        self.min_speedup = min_speedup
+        self.task_time = task_time
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._pools = {}
+
+    @classmethod
+    def shared(cls):
+        """
+        :return: the planner used by `adaptive()` when no planner is given
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def method_name(method):
+        """
+        :param method: bound method forwarded onto an item
+        :return: the key used for plans and statistics of method
+        """
+        return (
+            getattr(method, "__qualname__", None)
+            or getattr(method, "__name__", None)
+            or type(method).__name__
+        )
+
+    @property
+    def plans(self):
+        """
+        :return: {method name: ExecutionPlan} for each method that has been planned
+        """
+        with self._lock:
+            return {
+                name: stats["plan"]
+                for name, stats in self._stats.items()
+                if stats["plan"] is not None
+            }
+
+    @property
+    def stats(self):
+        """
+        :return: {method name: ExecutionStats} for each method called so far
+        """
+        with self._lock:
+            return {
+                name: ExecutionStats(
+                    calls=stats["calls"],
+                    items=stats["items"],
+                    total_time=stats["total_time"],
+                    item_wall=stats["item_wall"],
+                    item_cpu=stats["item_cpu"],
+                    speedup=stats["speedup"],
+                    releases_gil=(
+                        None if stats["speedup"] is None
+                        else stats["speedup"] >= self.min_speedup
+                    ),
+                    plan=stats["plan"],
+                )
+                for name, stats in self._stats.items()
+            }
+
+    def _pool(self, strategy):
+        with self._lock:
+            pool = self._pools.get(strategy)
+            if pool is None:
+                executor = (
+                    futures.ThreadPoolExecutor if strategy == THREAD
+                    else futures.ProcessPoolExecutor
+                )
+                pool = self._pools[strategy] = executor(max_workers=self.max_workers)
+            return pool
+
+    def _chunksize(self, item_wall):
+        """
+        :param item_wall: seconds per item
+        :return: number of items per pool task to run for about `task_time` seconds
+        """
+        if not item_wall:
+            return None
+        return max(1, int(math.ceil(self.task_time / item_wall)))
+
+    def _dispatch(self, plan, methods, args, kwargs):
+        """
+        :param plan: ExecutionPlan to run the calls with
+        :param methods: sequence of bound methods
+        :return: list of results of calling each method with args and kwargs
+        """
+        if plan.strategy == SERIAL:
+            return [m(*args, **kwargs) for m in methods]
+        calls = [(m, args, kwargs) for m in methods]
+        if plan.strategy == PROCESS and not self._picklable(*calls):
+            # the pool would fail part way through the call
+            return [m(*args, **kwargs) for m in methods]
+        # keep a few tasks per worker to balance uneven items
+        balanced = int(math.ceil(len(calls) / float(plan.workers * 4)))
+        chunksize = max(1, min(plan.chunksize or balanced, balanced))
+        chunks = [calls[ix:ix + chunksize] for ix in range(0, len(calls), chunksize)]
+        results = self._pool(plan.strategy).map(_call_chunk, chunks)
+        return list(itertools.chain.from_iterable(results))
+
+    @staticmethod
+    def _picklable(*objects):
+        try:
+            # pickle the way the process pool will
+            ForkingPickler(io.BytesIO(), -1).dump(objects)
+        except Exception:
+            return False
+        return True
+
+    def _plan(self, stats, speedup, methods, args, kwargs):
+        """
+        :param stats: statistics of the method being planned
+        :param speedup: thread pool speedup over serial dispatch, or None if the
+                        method is too cheap to try the thread pool
+        :return: ExecutionPlan for later calls of the method
+        """
+        item_wall = stats["item_wall"]
+        chunksize = self._chunksize(item_wall)
+        if speedup is not None and speedup >= self.min_speedup:
+            return ExecutionPlan(THREAD, self.max_workers, chunksize)
+        if (
+            speedup is not None
+            and self.processes
+            and item_wall >= self.process_item_time
+            and self._picklable(methods[0], args, kwargs)
+        ):
+            return ExecutionPlan(PROCESS, self.max_workers, chunksize)
+        return ExecutionPlan(SERIAL, 1, None)
+
+    def call(self, methods, args=(), kwargs=None):
+        """
+        Call each method with args and kwargs, choosing the dispatch strategy from
+        the measurements of previous calls.
+
+        :param methods: sequence of bound methods of the same name
+        :return: list of results
+        """
+        kwargs = kwargs or {}
+        if not methods:
+            return []
+        name = self.method_name(methods[0])
+        n_items = len(methods)
+        with self._lock:
+            stats = self._stats.setdefault(
+                name,
+                dict(
+                    calls=0, items=0, total_time=0.0, item_wall=None, item_cpu=None,
+                    speedup=None, plan=None,
+                ),
+            )
+            plan = stats["plan"]
+            sampled = stats["item_wall"] is not None
+        start = _wall_time()
+        if plan is not None:
+            results = self._dispatch(plan, methods, args, kwargs)
+            elapsed = _wall_time() - start
+        elif not sampled or n_items < 2 or self.max_workers < 2:
+            # measure the serial cost per item
+            start_cpu = _cpu_time()
+            results = [m(*args, **kwargs) for m in methods]
+            elapsed = _wall_time() - start
+            cpu = _cpu_time() - start_cpu
+            with self._lock:
+                stats["item_wall"] = elapsed / n_items
+                stats["item_cpu"] = cpu / n_items
+                if stats["item_wall"] < self.min_item_time or self.max_workers < 2:
+                    stats["plan"] = self._plan(stats, None, methods, args, kwargs)
+        else:
+            # try the thread pool to find out whether the method releases the GIL
+            probe = ExecutionPlan(
+                THREAD, self.max_workers, self._chunksize(stats["item_wall"]),
+            )
+            results = self._dispatch(probe, methods, args, kwargs)
+            elapsed = _wall_time() - start
+            with self._lock:
+                stats["speedup"] = stats["item_wall"] * n_items / max(elapsed, 1e-9)
+                stats["plan"] = self._plan(stats, stats["speedup"], methods, args, kwargs)
+        with self._lock:
+            stats["calls"] += 1
+            stats["items"] += n_items
+            stats["total_time"] += elapsed
+        return results
+
+    def forward_method(self, forwarder, methods):
+        """
+        :param forwarder: SequenceForwarder the methods were forwarded from
+        :param methods: sequence of bound methods
+        :return: callable dispatching calls onto methods according to this planner
+        """
+        def wrapper(*args, **kwargs):
+            return forwarder._wrap_results(self.call(methods, args, kwargs))
+
+        if methods:
+            wrapper = update_wrapper(wrapper, methods[0])
+        return wrapper
+
+    def shutdown(self, wait=True):
+        """
+        Shut down the thread and process pools of this planner
+
+        :param wait: wait for pending calls to finish
+        """
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, evalue, traceback):
+        self.shutdown()
+
+
+class SequenceForwarder(Forwarder):
+    """
+    Base class for Forwarders over a sequence of items, which forward attribute access
+    onto each item and wrap the results with `_wrap_results`.
+
+    Subclasses also derive from a sequence type, and implement `_wrap_results` and
+    `_new_like`.
+    """
+
+    def _forward_attribute(self, attr):
+        return [getattr(x, attr) for x in self]
+
+    def _forward_method(self, methods):
+        def wrapper(*args, **kwargs):
+            return self._wrap_results([m(*args, **kwargs) for m in methods])
+
+        if methods:
+            wrapper = update_wrapper(wrapper, methods[0])
+
+        return wrapper
+
+    def _forward(self, attr):
+        """
+        Forward attribute lookup for `attr` onto each element of the list.
+
+        :param attr: name of the attribute to forward
+        :return: ForwarderList wrapping the result for non-callable attributes or
+                 Arbitrary callable returning a ForwarderList wrapping the result of
+                 calling the underlying method
+        """
+        results = self._forward_attribute(attr)
+        if results and all([callable(r) for r in results]):
+            return self._forward_method(results)
+        if results:
+            # Normal case, return a ForwarderList with the results
+            return self._wrap_results(results)
+        # Empty list
+        return results
+
+    def _scatter_method(self, methods):
+        """
+        Scatter iterables across forwarded method call
+
+        :param methods: sequence of bound methods
+        :return:
+        """
+
+        def iterable_arg(a):
+            if isinstance(a, six.string_types):
+                return itertools.cycle((a,))
+            try:
+                return itertools.cycle(a)
+            except TypeError:
+                return itertools.cycle((a,))
+
+        def iterable_kwarg(k, v):
+            if k.endswith("__"):
+                # double underscore isn't escaped
+                return k[:-1], iterable_arg(v)
+            if k.endswith("_"):
+                return k[:-1], itertools.cycle((v,))
+            return k, iterable_arg(v)
+
+        if not all([callable(m) for m in methods]):
+            raise RuntimeError(
+                "Cannot scatter onto non-callable attribute {!r}".format(
+                    [m for m in methods if not callable(m)],
+                ),
+            )
+
+        def wrapper(*args, **kwargs):
+            argset = [iterable_arg(a) for a in args]
+            arggen = (tuple(next(ai) for ai in argset) for _ in methods)
+            kwargset = dict(iterable_kwarg(k, v) for k, v in kwargs.items())
+            kwarggen = ({k: next(v) for k, v in kwargset.items()} for _ in methods)
+            return self._wrap_results(
+                [
+                    m(*iterargs, **iterkwargs)
+                    for m, iterargs, iterkwargs in zip(methods, arggen, kwarggen)
+                ],
+            )
+
+        if methods:
+            wrapper = update_wrapper(wrapper, methods[0])
+        return wrapper
+
+    def __getstate__(self):
+        # define the pickle protocol here, so it isn't forwarded onto the items
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _copy(self):
+        """
+        :return: shallow copy of this sequence of the same class, used by `scatter`
+                 and `adaptive`
+        """
+        return type(self)(self)
+
+    @property
+    def scatter(self):
+        """
+        Get a copy of the current ForwarderList that forwards iterable arguments to
+        method calls across the elements of the list.
+        """
+        scatter_forwarder = self._copy()
+        scatter_forwarder._forward_method = scatter_forwarder._scatter_method
+        return scatter_forwarder
+
+    def adaptive(self, planner=None):
+        """
+        Get a copy of the current list that dispatches forwarded method calls
+        serially, on a thread pool or on a process pool, as chosen by an
+        ExecutionPlanner from the measured cost of each method.
+
+        :param planner: ExecutionPlanner to use (default: `ExecutionPlanner.shared()`)
+        :return: copy of this list with adaptive method dispatch
+        """
+        planner = planner or ExecutionPlanner.shared()
+        adaptive_forwarder = self._copy()
+        adaptive_forwarder._forward_method = partial(
+            planner.forward_method, adaptive_forwarder,
+        )
+        return adaptive_forwarder
+
+    def __exit__(self, etype, evalue, traceback):
+        suppress_exception = False
+        for ex in self._forward_attribute("__exit__"):
+            if ex(etype, evalue, traceback):
+                suppress_exception = True
+        return suppress_exception
+
+    def concurrent_context(self, max_workers=None):
+        """
+        Get a context manager that enters and exits all items of the list in parallel,
+        e.g. `with connections.concurrent_context(max_workers=32) as sessions:`
+
+        Unlike `with fl:`, items that were already entered are exited if another
+        item fails to enter.
+
+        :param max_workers: size of the thread pool (default: executor default)
+        :rtype: ConcurrentForwarderContext
+        """
+        return ConcurrentForwarderContext(self, max_workers=max_workers)
+
+    def where(self, **lookups):
+        """
+        Select the items matching all lookups, e.g.
+        `fl.where(identifier__gt=0.5, nesting_level=0)`.
+
+        Each lookup is an attribute name with an optional operator suffix from
+        WHERE_OPERATORS (default "exact"). The predicate is compiled once per proxied
+        type and set of lookups, and the result keeps the class of this list.
+
+        :param lookups: {"attribute__operator": value}
+        :return: ForwarderList of the matching items
+        """
+        parsed, values = parse_where_lookups(lookups)
+        proxy_onto = getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None)
+        key = (proxy_onto, parsed)
+        predicate = _where_predicates.get(key)
+        if predicate is None:
+            if proxy_onto is not None:
+                for attr, _ in parsed:
+                    if not (hasattr(type(self), attr) or hasattr(type(self), attr + "_")):
+                        warnings.warn(
+                            "{!r} is not a forwarded attribute of {!r} ({!r})".format(
+                                attr, proxy_onto, self,
+                            ),
+                        )
+            predicate = _where_predicates.get_or_generate(
+                key, lambda: where_predicate(parsed),
+            )
+        return self._new_like(predicate(self, *values))
+
+    def sort_by(self, attr, reverse=False):
+        """
+        Sort the items by the value of a forwarded attribute, which is looked up once
+        per item. The sort is stable, and the result keeps the class of this list.
+
+        :param attr: name of the forwarded attribute to sort by
+        :param reverse: sort in descending order
+        :return: sorted copy of this list
+        """
+        keys = self._forward_attribute(attr)
+        items = list(self)
+        order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+        return self._new_like([items[ix] for ix in order])
+
+    def top_k(self, attr, k, largest=True):
+        """
+        Select the k items with the largest (or smallest) value of a forwarded
+        attribute, in order, without sorting the whole list. Ties keep the order of
+        this list, as with `sort_by(attr, reverse=largest)[:k]`.
+
+        :param attr: name of the forwarded attribute to rank by
+        :param k: number of items to select
+        :param largest: select the largest values if True, else the smallest
+        :return: list of the selected items, of the same class as this list
+        """
+        keys = self._forward_attribute(attr)
+        items = list(self)
+        select = heapq.nlargest if largest else heapq.nsmallest
+        order = select(k, range(len(items)), key=keys.__getitem__)
+        return self._new_like([items[ix] for ix in order])
+
+    def group_by(self, attr):
+        """
+        Group the items by the value of a forwarded attribute, which is looked up once
+        per item.
+
+        :param attr: name of the forwarded attribute to group by (values must be
+                     hashable)
+        :rtype: collections.OrderedDict
+        :return: {value: list of the items with that value, of the same class as this
+                 list}, in order of first occurrence
+        """
+        groups = collections.OrderedDict()
+        for key, item in zip(self._forward_attribute(attr), self):
+            groups.setdefault(key, []).append(item)
+        for key, items in groups.items():
+            groups[key] = self._new_like(items)
+        return groups
+
+    def flatten(self, attr):
+        """
+        Forward a one-to-many attribute (an attribute holding a sequence of items) and
+        concatenate the sequences into one flat list, e.g. `fl.flatten("children")`.
+
+        The item type of the flat list is inferred once, and further forwarding runs on
+        the flat list. Use `regroup` to group the results by parent again.
+
+        :param attr: name of the forwarded attribute holding a sequence of items
+        :rtype: RaggedForwarderList
+        :return: flat list of all items with offsets of each parent's items
+        """
+        items = []
+        offsets = [0]
+        for x in self:
+            items.extend(getattr(x, attr))
+            offsets.append(len(items))
+        return RaggedForwarderList(
+            items, offsets=(tuple(offsets),), proxy_onto=bool(self.proxy_onto),
+        )
+
+
+class ForwarderList(with_metaclass(TypedForwarderListMeta, list, SequenceForwarder)):
+    """
+    Forward arbitrary attribute access on the list to each item of the list
+    and return a ForwarderList containing the results.
+    """
+
+    def __init__(self, iterable, proxy_onto=None):
+        """
+        :param iterable: The iterable to seed the IterList with
+        :param proxy_onto: The class of objects in the list -- This is interpreted by
+               the TypedForwarderMeta class
+        """
+        super(ForwarderList, self).__init__(iterable)
+        self.proxy_onto = (
+            proxy_onto
+            if proxy_onto
+            else getattr(self, TypedForwarderMeta.PROXY_ONTO_TAG, None)
+        )
+
+    def _widen_proxy_onto(self, items):
+        """
+        Merge the types of items added to a typed list into its common type.
+
+        Only new types that are not already a subclass of the common type are merged.
+        The class of this instance is swapped for the typed forwarder of the new
+        common type only if the common type actually changed. Statically typed
+        (PROXY_ONTO) classes are never swapped.
+
+        :param items: sequence of items that were added to the list
+        """
+        proxy_onto = self.__dict__.get("proxy_onto")
+        if not proxy_onto or not items:
+            # untyped list (or still being unpickled)
+            return
+        cls = type(self)
+        forwarder_base = cls.__dict__.get(TypedForwarderMeta.FORWARDER_BASE_TAG)
+        current = getattr(cls, TypedForwarderMeta.PROXY_ONTO_TAG, object)
+        if forwarder_base is None:
+            if current is not object or proxy_onto is not True or len(self) != len(items):
+                # static PROXY_ONTO or heterogeneous list
+                return
+            # first items added to an empty, automatically typed list
+            forwarder_base = cls
+            common = cls._common_type_from_sequence(items)
+        else:
+            common = current
+            for new_type in {type(item) for item in items}:
+                if not issubclass(new_type, common):
+                    common = common_subclass(common, new_type)
+        base_proxy_onto = getattr(forwarder_base, TypedForwarderMeta.PROXY_ONTO_TAG, object)
+        if common is current or not issubclass(common, base_proxy_onto):
+            return
+        if common is base_proxy_onto:
+            self.__class__ = forwarder_base
+        else:
+            self.__class__ = forwarder_base._typed_forwarder_cls(common)
+        if proxy_onto is not True:
+            self.proxy_onto = common
+
+    def _indexes(self):
+        """
+        :return: the ForwarderIndex objects built over this list
+        """
+        # avoid __getattr__, which would forward the lookup onto the items
+        return self.__dict__.get("_forward_indexes", {}).values()
+
+    def _appended(self, items):
+        """
+        Called after items are added to the end of the list
+
+        :param items: sequence of appended items
+        """
+        self._widen_proxy_onto(items)
+        for index in self._indexes():
+            index._append(items)
+
+    def _changed(self, items=()):
+        """
+        Called after items are inserted, replaced, removed or reordered
+
+        :param items: sequence of added items
+        """
+        self._widen_proxy_onto(items)
+        for index in self._indexes():
+            index.invalidate()
+
+    def append(self, item):
+        """
+        Append item, widening the proxied type and updating indexes
+        """
+        super(ForwarderList, self).append(item)
+        self._appended((item,))
+
+    def extend(self, iterable):
+        """
+        Extend with the items of iterable, widening the proxied type and updating indexes
+        """
+        if iterable is self or not isinstance(iterable, collections_abc.Sequence):
+            # snapshot self, so the appended items don't include the extension
+            iterable = tuple(iterable)
+        super(ForwarderList, self).extend(iterable)
+        self._appended(iterable)
+
+    def insert(self, index, item):
+        """
+        Insert item before index, widening the proxied type and invalidating indexes
+        """
+        super(ForwarderList, self).insert(index, item)
+        self._changed((item,))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = tuple(value)
+            super(ForwarderList, self).__setitem__(index, value)
+            self._changed(value)
+        else:
+            super(ForwarderList, self).__setitem__(index, value)
+            self._changed((value,))
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __delitem__(self, index):
+        super(ForwarderList, self).__delitem__(index)
+        self._changed()
+
+    if six.PY2:
+        # list implements simple slices with these on Python 2, bypassing the hooks
+        def __setslice__(self, start, stop, value):
+            self.__setitem__(slice(max(0, start), max(0, stop)), value)
+
+        def __delslice__(self, start, stop):
+            self.__delitem__(slice(max(0, start), max(0, stop)))
+
+    def __imul__(self, n):
+        result = super(ForwarderList, self).__imul__(n)
+        self._changed()
+        return result
+
+    def pop(self, *args):
+        """
+        Remove and return the item at index (default last), invalidating indexes
+        """
+        item = super(ForwarderList, self).pop(*args)
+        self._changed()
+        return item
+
+    def remove(self, item):
+        """
+        Remove the first occurrence of item, invalidating indexes
+        """
+        super(ForwarderList, self).remove(item)
+        self._changed()
+
+    def reverse(self):
+        """
+        Reverse the list in place, invalidating indexes
+        """
+        super(ForwarderList, self).reverse()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        """
+        Sort the list in place, invalidating indexes
+        """
+        super(ForwarderList, self).sort(*args, **kwargs)
+        self._changed()
+
+    def clear(self):
+        """
+        Remove all items, invalidating indexes
+        """
+        self.__delitem__(slice(None))
+
+    def __reduce__(self):
+        """
+        Pickle as (class, items, state). Typed classes are pickled as their base class
+        and proxied type by `reduce_forwarder_cls`, once per pickle stream.
+        """
+        state = dict(self.__dict__)
+        # indexes are rebuilt on demand
+        state.pop("_forward_indexes", None)
+        default_proxy_onto = getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None)
+        if state == {"proxy_onto": default_proxy_onto}:
+            # the default state is restored by __init__
+            return type(self), (list(self),)
+        return type(self), (list(self),), state
+
+    def _new_like(self, iterable):
+        """
+        :param iterable: items of the new list
+        :return: a new list of the same (typed) class as this list, without
+                 re-inferring the type of the items
+        """
+        selection = type(self)(iterable)
+        selection.proxy_onto = self.proxy_onto
+        return selection
+
+    def index_by(self, attr, ordered=False):
+        """
+        Index the items of this list by the value of a forwarded attribute.
+
+        The index is cached on the list, so repeated calls return the same index.
+
+        :param attr: name of the forwarded attribute to index items by
+        :param ordered: if True, also maintain a sorted index for `range` queries
+        :rtype: ForwarderIndex
+        :return: index mapping attribute values to selections of this list
+        """
+        indexes = self.__dict__.setdefault("_forward_indexes", {})
+        index = indexes.get(attr)
+        if index is None:
+            index = indexes[attr] = ForwarderIndex(self, attr, ordered=ordered)
+        elif ordered and not index.ordered:
+            index.ordered = True
+        return index
+
+    def _wrap_results(self, results):
+        """
+        :param results: list of results forwarded from each item
+        :return: ForwarderList of the results, typed if this list is typed
+        """
+        return ForwarderList(results, proxy_onto=bool(self.proxy_onto))
+
+    def __getitem__(self, item):
+        """
+        Override __getitem__ to return a base ForwarderList for the slice.
+
+        This is a way to convert a ReducingForwarderList into a regular ForwarderList.
+
+        Any default ForwarderList subclass however will be used instead of the
+        base ForwarderList class if proxy_onto is specified
+        """
+        selection = super(ForwarderList, self).__getitem__(item)
+        if isinstance(item, slice):
+            return ForwarderList(selection, proxy_onto=bool(self.proxy_onto))
+        return selection
+
+
+class ReducingForwarderList(ForwarderList):
+    """
+    A ForwarderList that returns a bare item rather than a ForwarderList if the length
+    of the resulting list is 1
+    """
 
     def _forward(self, attr):
         return self._reduce(super(ReducingForwarderList, self)._forward(attr))
@@ -669,11 +2016,11 @@ class ReducingForwarderList(ForwarderList):
         """
         If the sequence has 1 item, return sequence[0]
         """
-        if callable(sequence) and not isinstance(sequence, ForwarderList):
+        if callable(sequence) and not isinstance(sequence, SequenceForwarder):
 
             @wraps(sequence)
             def wrapper(*args, **kwargs):
-                return ForwarderList._reduce(sequence(*args, **kwargs))
+                return ReducingForwarderList._reduce(sequence(*args, **kwargs))
 
             return wrapper
 
@@ -684,3 +2031,700 @@ class ReducingForwarderList(ForwarderList):
             return sequence
         except IndexError:
             return sequence[0]
+
+
+class ForwarderTuple(with_metaclass(TypedForwarderListMeta, tuple, SequenceForwarder)):
+    """
+    Immutable, hashable variant of ForwarderList.
+
+    The proxied type is only held by the (typed) class, so instances carry no state
+    besides their items, and selections of a typed ForwarderTuple reuse its class
+    instead of inferring the type of the items again. Forwarded results are returned
+    as ForwarderTuples.
+    """
+
+    def __new__(cls, iterable=(), proxy_onto=None):
+        """
+        :param iterable: The items of the tuple
+        :param proxy_onto: The class of objects in the tuple -- This is interpreted by
+               the TypedForwarderMeta class
+        """
+        return super(ForwarderTuple, cls).__new__(cls, iterable)
+
+    def __init__(self, iterable=(), proxy_onto=None):
+        """
+        Do nothing: `__new__` sets the items, and the typed class carries `proxy_onto`.
+        """
+
+    @property
+    def proxy_onto(self):
+        """
+        :return: The class of objects in the tuple, or None if untyped
+        """
+        return getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None)
+
+    def _typed_base(self):
+        """
+        :return: the base ForwarderTuple class for the proxied type of this tuple
+        """
+        proxy_onto = self.proxy_onto
+        if proxy_onto is None:
+            return ForwarderTuple
+        return ForwarderTuple._typed_forwarder_cls(proxy_onto)
+
+    def _new_like(self, iterable):
+        """
+        :param iterable: items of the new tuple
+        :return: a new tuple of the same (typed) class as this tuple
+        """
+        return type(self)(iterable)
+
+    def _wrap_results(self, results):
+        """
+        :param results: list of results forwarded from each item
+        :return: ForwarderTuple of the results, typed if this tuple is typed
+        """
+        return ForwarderTuple(results, proxy_onto=self.proxy_onto is not None)
+
+    def __getitem__(self, item):
+        """
+        Override __getitem__ to return a base ForwarderTuple of the same proxied type
+        for the slice.
+        """
+        selection = super(ForwarderTuple, self).__getitem__(item)
+        if isinstance(item, slice):
+            return self._typed_base()(selection)
+        return selection
+
+
+class ReducingForwarderTuple(ForwarderTuple):
+    """
+    A ForwarderTuple that returns a bare item rather than a ForwarderTuple if the
+    length of the resulting tuple is 1
+    """
+
+    def _forward(self, attr):
+        return self._reduce(super(ReducingForwarderTuple, self)._forward(attr))
+
+    _reduce = staticmethod(ReducingForwarderList._reduce)
+
+
+class RaggedForwarderList(ForwarderList):
+    """
+    A flat ForwarderList of the items of one or more levels of nested sequences, as
+    returned by `ForwarderList.flatten`.
+
+    `offsets` holds a tuple of group boundaries for each nesting level, outermost
+    first. The items of group `i` of the innermost level are
+    `self[offsets[-1][i]:offsets[-1][i + 1]]`, and each outer level groups the groups
+    of the level below it in the same way. An `offsets` attribute of the items is
+    forwarded as `offsets_`.
+
+    Forwarded attribute and method results keep the offsets of this list. Mutating
+    the list invalidates its offsets (they become None), after which `regroup` raises
+    ValueError.
+    """
+
+    def __init__(self, iterable, offsets=(), proxy_onto=None):
+        """
+        :param iterable: The flat items
+        :param offsets: tuple of group boundaries for each nesting level
+        :param proxy_onto: The class of objects in the list -- This is interpreted by
+               the TypedForwarderMeta class
+        """
+        super(RaggedForwarderList, self).__init__(iterable, proxy_onto=proxy_onto)
+        self._ragged_offsets = offsets
+
+    @property
+    def offsets(self):
+        """
+        Get the group boundaries for each nesting level, or None if the list was
+        mutated
+        """
+        # avoid __getattr__, which would forward the lookup onto the items
+        return self.__dict__.get("_ragged_offsets", ())
+
+    def _appended(self, items):
+        super(RaggedForwarderList, self)._appended(items)
+        self._ragged_offsets = None
+
+    def _changed(self, items=()):
+        super(RaggedForwarderList, self)._changed(items)
+        self._ragged_offsets = None
+
+    def _copy(self):
+        return type(self)(self, offsets=self.offsets)
+
+    def _wrap_results(self, results):
+        return RaggedForwarderList(
+            results, offsets=self.offsets, proxy_onto=bool(self.proxy_onto),
+        )
+
+    def _forward(self, attr):
+        results = super(RaggedForwarderList, self)._forward(attr)
+        if not self:
+            # keep the offsets of empty groups
+            return self._wrap_results(results)
+        return results
+
+    def _new_like(self, iterable):
+        # selections don't keep the nesting structure
+        return ForwarderList(
+            iterable,
+            proxy_onto=getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None),
+        )
+
+    def flatten(self, attr):
+        """
+        Flatten one more level of nesting, keeping the offsets of the levels above.
+
+        :param attr: name of the forwarded attribute holding a sequence of items
+        :rtype: RaggedForwarderList
+        :return: flat list of all items with offsets of each level
+        """
+        flattened = super(RaggedForwarderList, self).flatten(attr)
+        offsets = self.offsets
+        flattened._ragged_offsets = (
+            None if offsets is None else offsets + flattened.offsets
+        )
+        return flattened
+
+    def regroup(self):
+        """
+        :return: nested ForwarderLists (one level per level of offsets) grouping the
+                 items of this list by parent
+        :raises: ValueError if the offsets were invalidated by mutating the list
+        """
+        if self.offsets is None:
+            raise ValueError("Cannot regroup a RaggedForwarderList that was mutated")
+        groups = list(self)
+        group_cls = ForwarderList
+        proxy_onto = getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None)
+        if proxy_onto is not None:
+            group_cls = ForwarderList._typed_forwarder_cls(proxy_onto)
+        for level in reversed(self.offsets):
+            groups = [
+                group_cls(groups[start:stop]) for start, stop in zip(level, level[1:])
+            ]
+            # the next level groups lists of the same class
+            group_cls = ForwarderList._typed_forwarder_cls(group_cls)
+        return group_cls(groups)
+
+
+class MemoizingForwarderList(ForwarderList):
+    """
+    A ForwarderList for immutable items which caches forwarded attribute values and
+    method results per item.
+
+    Set MEMOIZE to a sequence of attribute names to only cache those attributes
+    (default: all forwarded attributes). Results are keyed by item identity and
+    hashable call arguments, and stored in a per-class LRU cache of at most
+    MEMOIZE_MAXSIZE entries. Calls with unhashable arguments are never cached.
+    """
+
+    MEMOIZE = True
+    MEMOIZE_MAXSIZE = 1024
+
+    def _memoized(self, attr):
+        """
+        :param attr: name of the attribute to forward
+        :return: True if results for `attr` should be cached
+        """
+        memoize = getattr(type(self), TypedForwarderListMeta.MEMOIZE_TAG, ())
+        return memoize is True or attr in memoize
+
+    def _forward_attribute(self, attr):
+        if not self._memoized(attr):
+            return super(MemoizingForwarderList, self)._forward_attribute(attr)
+        cache = self._memo_cache
+        return [memoized_attribute(cache, x, attr) for x in self]
+
+    def cache_info(self):
+        """
+        :rtype: CacheInfo
+        :return: statistics of the result cache shared by this class
+        """
+        return self._memo_cache.info()
+
+    def cache_clear(self):
+        """
+        Drop all cached results for all items of this class
+        """
+        self._memo_cache.clear()
+
+    def invalidate(self, *attrs):
+        """
+        Drop cached results for the items in this list.
+
+        :param attrs: only drop results for these attribute names
+        :return: the number of dropped results
+        """
+        return self._memo_cache.invalidate(items=self, attrs=attrs or None)
+
+
+# commands understood by shard_worker
+_SHARD_FORWARD = "forward"
+_SHARD_CALL = "call"
+_SHARD_ITEMS = "items"
+_SHARD_CLOSE = "close"
+# reply from shard_worker when a forwarded attribute is callable on every item
+_SHARD_CALLABLE = "callable"
+
+
+def shard_worker(connection, items):
+    """
+    Main loop of a ShardedForwarderList worker process.
+
+    Receives (command, args) messages and replies with (True, result) or
+    (False, exception) until the connection is closed or a close command arrives.
+
+    :param connection: multiprocessing Connection to the ShardedForwarderList
+    :param items: the items resident in this shard
+    """
+    while True:
+        try:
+            command, args = connection.recv()
+        except EOFError:
+            break
+        if command == _SHARD_CLOSE:
+            break
+        try:
+            if command == _SHARD_FORWARD:
+                values = [getattr(x, args[0]) for x in items]
+                if values and all([callable(v) for v in values]):
+                    # bound methods stay in the shard, only the marker is sent back
+                    values = _SHARD_CALLABLE
+                reply = (True, values)
+            elif command == _SHARD_CALL:
+                attr, call_args, call_kwargs = args
+                reply = (True, [getattr(x, attr)(*call_args, **call_kwargs) for x in items])
+            elif command == _SHARD_ITEMS:
+                reply = (True, items)
+            else:
+                reply = (False, ValueError("Unknown shard command {!r}".format(command)))
+        except Exception as e:  # pylint: disable=broad-except
+            reply = (False, e)
+        try:
+            connection.send(reply)
+        except Exception as e:  # pylint: disable=broad-except
+            # result or exception could not be pickled
+            connection.send((False, RuntimeError(repr(e))))
+    connection.close()
+
+
+class ShardedForwarderList(with_metaclass(TypedForwarderListMeta, Forwarder)):
+    """
+    Forward attribute access and method calls onto items that live permanently in a set
+    of worker processes.
+
+    Items are pickled once, when the workers are started. Forwarded attribute reads
+    and method calls are sent to every shard as small messages and the results are
+    gathered in order into a local ForwarderList. The `proxy_onto` keyword creates the
+    same typed interface as for a ForwarderList.
+
+    Used as a context manager, a ShardedForwarderList stops its workers on exit
+    (rather than forwarding the context manager protocol onto its items).
+    """
+
+    def __init__(self, iterable, shards=None, proxy_onto=None):
+        """
+        :param iterable: The items to distribute across the shards
+        :param shards: number of worker processes (default: number of CPUs)
+        :param proxy_onto: The class of objects in the list -- This is interpreted by
+               the TypedForwarderListMeta class
+        """
+        items = list(iterable)
+        # one request at a time, so concurrent callers don't receive each other's replies
+        self._request_lock = threading.Lock()
+        self._callable_attributes = set()
+        self.proxy_onto = (
+            proxy_onto
+            if proxy_onto
+            else getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None)
+        )
+        self._length = len(items)
+        shards = max(1, min(shards or multiprocessing.cpu_count(), len(items)))
+        chunk_size = -(-len(items) // shards)
+        self._connections = []
+        self._processes = []
+        for start in range(0, max(len(items), 1), max(chunk_size, 1)):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=shard_worker,
+                args=(worker_connection, items[start:start + chunk_size]),
+            )
+            process.daemon = True
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def _request(self, command, *args):
+        """
+        Send a command to every shard and gather the replies in shard order.
+
+        :param command: one of the shard_worker commands
+        :param args: arguments of the command
+        :return: list of per-shard results
+        :raises: the first exception raised by any shard
+        """
+        results = []
+        error = None
+        with self._request_lock:
+            connections = self.__dict__.get("_connections")
+            if not connections:
+                raise RuntimeError("{} is closed".format(type(self).__name__))
+            for connection in connections:
+                connection.send((command, args))
+            # drain every reply, even after an error, to keep the shards in sync
+            for connection in connections:
+                ok, result = connection.recv()
+                if ok:
+                    results.append(result)
+                elif error is None:
+                    error = result
+        if error is not None:
+            raise error
+        return results
+
+    def _remote_method(self, attr):
+        def wrapper(*args, **kwargs):
+            results = self._request(_SHARD_CALL, attr, args, kwargs)
+            return ForwarderList(
+                list(itertools.chain.from_iterable(results)),
+                proxy_onto=bool(self.proxy_onto),
+            )
+
+        wrapper.__name__ = str(attr)
+        return wrapper
+
+    def _forward(self, attr):
+        """
+        Forward attribute lookup for `attr` onto each item in each shard.
+
+        :param attr: name of the attribute to forward
+        :return: ForwarderList wrapping the gathered results for non-callable
+                 attributes or callable forwarding the method call to the shards
+        """
+        if attr in self.__dict__.get("_callable_attributes", ()):
+            return self._remote_method(attr)
+        results = self._request(_SHARD_FORWARD, attr)
+        if all([r == _SHARD_CALLABLE for r in results]):
+            self._callable_attributes.add(attr)
+            return self._remote_method(attr)
+        if any([r == _SHARD_CALLABLE for r in results]):
+            raise TypeError(
+                "{!r} is callable on some shards but not others".format(attr),
+            )
+        results = list(itertools.chain.from_iterable(results))
+        if results:
+            return ForwarderList(results, proxy_onto=bool(self.proxy_onto))
+        return results
+
+    def __len__(self):
+        return self._length
+
+    def gather(self):
+        """
+        :return: ForwarderList with a local copy of the items in all shards
+        """
+        return ForwarderList(
+            list(itertools.chain.from_iterable(self._request(_SHARD_ITEMS))),
+            proxy_onto=bool(self.proxy_onto),
+        )
+
+    def close(self):
+        """
+        Stop the worker processes. The items resident in the shards are discarded.
+        """
+        with self._request_lock:
+            connections = self.__dict__.get("_connections") or []
+            self._connections = []
+            for connection in connections:
+                try:
+                    connection.send((_SHARD_CLOSE, ()))
+                except (IOError, OSError):
+                    pass
+                connection.close()
+        for process in self.__dict__.get("_processes", []):
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, evalue, traceback):
+        self.close()
+
+
+SharedRecordLayout = collections.namedtuple(
+    "SharedRecordLayout", ("name", "record_type", "length", "fields"),
+)
+
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def shared_field_format(name, values):
+    """
+    :param name: name of the record field
+    :param values: the values of the field for every record
+    :return: struct format character able to store all values
+    :raises: TypeError if the values can't be stored in shared memory
+    """
+    if all([isinstance(v, bool) for v in values]):
+        return "?"
+    if all([isinstance(v, six.integer_types) and not isinstance(v, bool) for v in values]):
+        if not all([_INT64_MIN <= v <= _INT64_MAX for v in values]):
+            raise TypeError(
+                "Field {!r} can't be stored in shared memory, int values must fit in "
+                "64 bits".format(name),
+            )
+        return "q"
+    if all([isinstance(v, six.integer_types + (float,)) for v in values]):
+        return "d"
+    raise TypeError(
+        "Field {!r} can't be stored in shared memory, only bool, int and float "
+        "values are supported".format(name),
+    )
+
+
+def attach_shared_records(forwarder_cls, layout, proxy_onto=None):
+    """
+    Unpickle helper for SharedRecordList
+
+    :param forwarder_cls: SharedRecordList or subclass to attach with
+    :param layout: SharedRecordLayout of the shared memory block
+    :param proxy_onto: passed on to `SharedRecordList.attach`
+    :return: SharedRecordList attached to the existing shared memory block
+    """
+    return forwarder_cls.attach(layout, proxy_onto=proxy_onto)
+
+
+class SharedRecordList(with_metaclass(TypedForwarderListMeta, Forwarder)):
+    """
+    Forward attribute access onto attrs records whose fields are stored column-wise
+    in a `multiprocessing.shared_memory` block.
+
+    Other processes attach to the block by name (pickling a SharedRecordList only
+    sends its SharedRecordLayout), so record fields are read in every process
+    without copying the record set. Only stored fields are forwarded, and reads come
+    straight from the shared buffer. Other attributes and methods of the records
+    (properties, methods, fields not passed to the initializer) raise AttributeError:
+    they would run on records re-created from the fields, so any changes they make
+    would be lost. Use `records()` to forward onto such copies explicitly. Iterating
+    and indexing also return re-created records.
+
+    Only fields passed to the record initializer with bool, int or float values can
+    be stored. All records must be of the same attrs class.
+
+    Used as a context manager, the shared memory block is closed (and unlinked by the
+    creating process) on exit.
+    """
+
+    def __init__(self, iterable, proxy_onto=None, formats=None):
+        """
+        :param iterable: attrs records to store in shared memory
+        :param proxy_onto: The class of the records -- This is interpreted by the
+               TypedForwarderListMeta class
+        :param formats: optional dict of {field: struct format character} overriding
+               the format inferred from the values of the field
+        :raises: TypeError if the records can't be stored in shared memory
+        """
+        if shared_memory is None:
+            raise TypeError("SharedRecordList requires multiprocessing.shared_memory")
+        items = list(iterable)
+        record_type = getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None)
+        if record_type is None and items:
+            record_type = type(items[0])
+        if not hasattr(record_type, "__attrs_attrs__"):
+            raise TypeError(
+                "SharedRecordList requires attrs records, not {!r}".format(record_type),
+            )
+        if any([type(item) is not record_type for item in items]):
+            raise TypeError("All records must be of type {!r}".format(record_type))
+        formats = formats or {}
+        fields = []
+        columns = []
+        offset = 0
+        for field in record_type.__attrs_attrs__:
+            if not field.init:
+                continue
+            values = [getattr(item, field.name) for item in items]
+            fmt = formats.get(field.name) or shared_field_format(field.name, values)
+            # align every column on an 8 byte boundary
+            offset = -(-offset // 8) * 8
+            fields.append((field.name, fmt, offset))
+            columns.append(values)
+            offset += struct.calcsize(fmt) * len(items)
+        memory = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            for field, values in zip(fields, columns):
+                name, fmt, field_offset = field
+                struct.pack_into(
+                    "{}{}".format(len(items), fmt), memory.buf, field_offset, *values
+                )
+        except (struct.error, OverflowError) as err:
+            # don't leak the block when a (formats override) value doesn't fit
+            memory.close()
+            memory.unlink()
+            raise TypeError(
+                "Field {!r} can't be stored in shared memory: {}".format(name, err),
+            )
+        layout = SharedRecordLayout(memory.name, record_type, len(items), tuple(fields))
+        self._attach(layout, memory, owner=True, proxy_onto=proxy_onto)
+
+    def _attach(self, layout, memory, owner, proxy_onto):
+        self._layout = layout
+        self._memory = memory
+        self._owner = owner
+        self._formats = {name: (fmt, offset) for name, fmt, offset in layout.fields}
+        self.proxy_onto = (
+            proxy_onto
+            if proxy_onto
+            else getattr(type(self), TypedForwarderMeta.PROXY_ONTO_TAG, None)
+        )
+
+    @classmethod
+    def attach(cls, layout, proxy_onto=None):
+        """
+        :param layout: SharedRecordLayout of an existing SharedRecordList
+        :param proxy_onto: True or the record type to create a typed SharedRecordList
+        :return: SharedRecordList reading the records in the existing shared memory
+        """
+        forwarder_cls = cls
+        if proxy_onto:
+            forwarder_cls = cls._typed_forwarder_cls(layout.record_type)
+        self = forwarder_cls.__new__(forwarder_cls)
+        self._attach(
+            layout,
+            shared_memory.SharedMemory(name=layout.name),
+            owner=False,
+            proxy_onto=proxy_onto,
+        )
+        return self
+
+    @property
+    def layout(self):
+        """
+        Get the SharedRecordLayout describing the shared memory block
+        """
+        return self._layout
+
+    def column(self, field):
+        """
+        :param field: name of a stored record field
+        :return: memoryview of the field values directly on the shared memory buffer.
+                 Release the view before closing the SharedRecordList.
+        """
+        fmt, offset = self._formats[field]
+        size = struct.calcsize(fmt) * self._layout.length
+        return self._memory.buf[offset:offset + size].cast(fmt)
+
+    def _field_values(self, field):
+        view = self.column(field)
+        try:
+            return view.tolist()
+        finally:
+            view.release()
+
+    def _records(self, item=None):
+        """
+        :param item: slice of the records to re-create (default: all records)
+        :return: generator of records re-created from the stored fields
+        """
+        if item is None:
+            item = slice(None)
+        record_type = self._layout.record_type
+        names = []
+        columns = []
+        for name, _, _ in self._layout.fields:
+            view = self.column(name)
+            try:
+                columns.append(view[item].tolist())
+            finally:
+                view.release()
+            names.append(name.lstrip("_"))
+        return (record_type(**dict(zip(names, row))) for row in zip(*columns))
+
+    def records(self):
+        """
+        :return: ForwarderList of copies of the records, re-created from the stored
+                 fields. Changes to the copies are not written back.
+        """
+        return ForwarderList(
+            list(self._records()),
+            proxy_onto=self._layout.record_type if self.proxy_onto else None,
+        )
+
+    def _forward(self, attr):
+        """
+        Forward attribute lookup for `attr` onto each record.
+
+        :param attr: name of the stored field to forward
+        :return: ForwarderList of the field values read from shared memory
+        :raises: AttributeError if attr is not a stored field
+        """
+        formats = self.__dict__.get("_formats")
+        if formats is None or attr not in formats:
+            raise AttributeError(
+                "{!r} is not a stored field of the shared records, use records() to "
+                "forward it onto copies of the records".format(attr),
+            )
+        results = self._field_values(attr)
+        if results:
+            return ForwarderList(results, proxy_onto=bool(self.proxy_onto))
+        return results
+
+    def __len__(self):
+        return self._layout.length
+
+    def __iter__(self):
+        return self._records()
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return ForwarderList(
+                list(self._records(item)),
+                proxy_onto=self._layout.record_type if self.proxy_onto else None,
+            )
+        if not -self._layout.length <= item < self._layout.length:
+            raise IndexError("SharedRecordList index out of range")
+        fields = {}
+        for name, _, _ in self._layout.fields:
+            view = self.column(name)
+            try:
+                fields[name.lstrip("_")] = view[item]
+            finally:
+                view.release()
+        return self._layout.record_type(**fields)
+
+    def __reduce__(self):
+        forwarder_cls = type(self)
+        forwarder_cls = forwarder_cls.__dict__.get(
+            TypedForwarderMeta.FORWARDER_BASE_TAG, forwarder_cls,
+        )
+        return attach_shared_records, (forwarder_cls, self._layout, bool(self.proxy_onto))
+
+    def close(self):
+        """
+        Close this process' mapping of the shared memory block
+        """
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Destroy the shared memory block. Only the creating process should unlink it.
+        """
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, evalue, traceback):
+        self.close()
+        if self._owner:
+            self.unlink()
@@ -1,12 +1,33 @@
 # XXX: python 2 / 3 compatibility
 from future.utils import with_metaclass
 
+import copy
+import inspect
+import multiprocessing
+import pickle
 import random
+import threading
+import time
+import warnings
 
 import attr
 import pytest
 
-from metaforward import ForwarderList, TypedForwarderListMeta
+import metaforward
+from metaforward import (
+    BoundOnceMethod,
+    ExecutionPlanner,
+    Forwarder,
+    ForwarderList,
+    ForwarderTuple,
+    MemoizingForwarderList,
+    RaggedForwarderList,
+    ReducingForwarderList,
+    ReducingForwarderTuple,
+    ShardedForwarderList,
+    SharedRecordList,
+    TypedForwarderListMeta,
+)
 
 
 class CalledIgnoredAttribute(Exception):
@@ -81,6 +102,56 @@ class SubItem2(Item):
         return self.token
 
 
+@attr.s(frozen=True)
+class FrozenItem(object):
+    """
+    Immutable item counting how often its attributes are computed
+    """
+    identifier = attr.ib(factory=random.random)
+    computed = attr.ib(factory=list, hash=False, eq=False)
+
+    @property
+    def expensive_property(self):
+        self.computed.append("expensive_property")
+        return self.identifier * 2
+
+    def pure_method(self, arg):
+        self.computed.append("pure_method")
+        return self.identifier + arg
+
+    def count_method(self, values):
+        self.computed.append("count_method")
+        return len(values)
+
+
+@attr.s
+class Parent(object):
+    children = attr.ib(factory=list)
+
+
+@attr.s
+class Segment(object):
+    offsets = attr.ib(default=0)
+
+    def shift(self, by):
+        return self.offsets + by
+
+
+@attr.s(slots=True)
+class SlotsItem(object):
+    identifier = attr.ib(default=0)
+
+
+class StatefulItem(object):
+    identifier = 0
+
+    def __init__(self, identifier=0):
+        self.identifier = identifier
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+
 class NotAnItem(object):
     class_attribute = "NotAnItem class_attribute"
 
@@ -107,6 +178,33 @@ class IgnoreTokenItemForwarderList(ForwarderList):
         return "Shadowing a dynamic attribute in the target class"
 
 
+class FrozenItemForwarderList(MemoizingForwarderList):
+    PROXY_ONTO = FrozenItem
+    MEMOIZE = ("expensive_property", )
+    MEMOIZE_MAXSIZE = 4
+
+
+class ItemForwarder(Forwarder):
+    PROXY_ONTO = Item
+
+
+class SpecializingItemForwarder(Forwarder):
+    PROXY_ONTO = Item
+    SPECIALIZE_THRESHOLD = 2
+
+
+class SpecializingItemForwarderList(ForwarderList):
+    PROXY_ONTO = Item
+    SPECIALIZE_THRESHOLD = 3
+
+
+class ForwardingItemForwarder(Forwarder):
+    PROXY_ONTO = Item
+
+    def _forward(self, attr):
+        return getattr(self._forward_target, attr)
+
+
 @pytest.fixture(params=[None, Item, True],
                 ids=["untyped", "typed", "typed_auto"],
                 scope="class")
@@ -169,6 +267,11 @@ class TestForwarderList(object):
         exp_value = ((ForwarderList, ), {"rval": random.random()})
         self.assert_forwarded_callable(forwarderlist_of_item, "method", exp_value, "TypedForwarderListFortuple", *exp_value[0], **exp_value[1])
 
+    def test_forward_method_arguments(self, forwarderlist_of_item):
+        assert all(nl == 2 for nl in forwarderlist_of_item.recursive(bump=2).nesting_level)
+        assert all(nl == 3 for nl in forwarderlist_of_item.recursive(3).nesting_level)
+        assert all(nl == 1 for nl in forwarderlist_of_item.recursive().nesting_level)
+
     def test_forward_ignored_attributes(self, forwarderlist_of_item):
         with pytest.raises(CalledIgnoredAttribute):
             forwarderlist_of_item._forward("_forward")()
@@ -244,6 +347,12 @@ class TestForwarderList(object):
             with context_forwarder as identifiers:
                 raise Exception("Uh oh")
 
+    def test_reducing(self):
+        reducing_forwarder = ReducingForwarderList([Item(identifier=1)], proxy_onto=True)
+        assert reducing_forwarder.identifier == 1
+        assert reducing_forwarder.method(2) == ((2, ), {})
+        assert list(ReducingForwarderList([Item(), Item()]).nesting_level) == [0, 0]
+
     def test_scatter(self):
         callable_forwarder = ForwarderList((CallableItem() for _ in range(10)))
         results = callable_forwarder.scatter((range(10)))
@@ -304,4 +413,865 @@ def test_metaclass_inheriting_from_non_forwarderlist():
 def test_subclass_inheriting_with_non_common_proxy_onto():
     with pytest.raises(TypeError):
         class BadSubclass(StaticItemForwarderList):
-            PROXY_ONTO = NotAnItem
\ No newline at end of file
+            PROXY_ONTO = NotAnItem
+
+
+class TestForwarderTuple(object):
+    def test_forwarding(self):
+        items = ForwarderTuple([Item(identifier=ix) for ix in range(5)], proxy_onto=True)
+        assert type(items).__name__ == "TypedForwarderTupleForItem"
+        assert items.proxy_onto is Item
+        identifiers = items.identifier
+        assert type(identifiers).__name__ == "TypedForwarderTupleForint"
+        assert identifiers == (0, 1, 2, 3, 4)
+        assert items.recursive(bump=2).nesting_level == (2, ) * 5
+        assert type(items[1:3]) is type(items)
+        assert items.where(identifier__gte=3).identifier == (3, 4)
+        # immutable, hashable and without per-instance state
+        assert hash(identifiers) == hash((0, 1, 2, 3, 4))
+        assert {identifiers: "key"}[(0, 1, 2, 3, 4)] == "key"
+        assert not items.__dict__
+        with pytest.raises(TypeError):
+            items[0] = Item()
+
+    def test_untyped(self):
+        items = ForwarderTuple([Item(), Item()])
+        assert type(items) is ForwarderTuple
+        assert items.proxy_onto is None
+        assert type(items.identifier) is ForwarderTuple
+
+    def test_reducing(self):
+        items = ReducingForwarderTuple([Item(identifier=1)], proxy_onto=True)
+        assert type(items).__name__ == "TypedReducingForwarderTupleForItem"
+        assert items.identifier == 1
+        assert items.recursive(bump=1).nesting_level == 1
+        pair = ReducingForwarderTuple([Item(identifier=1), Item(identifier=2)])
+        assert pair.identifier == (1, 2)
+        assert type(pair[:1]) is ForwarderTuple
+
+    def test_pickle(self):
+        items = ForwarderTuple([Item(identifier=ix) for ix in range(3)], proxy_onto=True)
+        unpickled = pickle.loads(pickle.dumps(items))
+        assert type(unpickled) is type(items)
+        assert unpickled.identifier == (0, 1, 2)
+
+
+class TestMemoizingForwarderList(object):
+    def test_memoize_property(self):
+        forwarder = MemoizingForwarderList((FrozenItem() for _ in range(3)), proxy_onto=True)
+        forwarder.cache_clear()
+        assert list(forwarder.expensive_property) == [x.identifier * 2 for x in forwarder]
+        assert list(forwarder.expensive_property) == [x.identifier * 2 for x in forwarder]
+        assert all(x.computed == ["expensive_property"] for x in forwarder)
+        info = forwarder.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (3, 3, 3)
+
+    def test_memoize_method(self):
+        forwarder = MemoizingForwarderList((FrozenItem() for _ in range(3)), proxy_onto=True)
+        forwarder.cache_clear()
+        first = forwarder.pure_method(1)
+        assert list(first) == list(forwarder.pure_method(1))
+        assert all(x.computed == ["pure_method"] for x in forwarder)
+        forwarder.pure_method(arg=2)
+        assert all(x.computed == ["pure_method"] * 2 for x in forwarder)
+        info = forwarder.cache_info()
+        assert (info.misses, info.currsize) == (6, 6)
+        # unhashable arguments are never cached
+        assert list(forwarder.count_method([1, 2])) == [2] * 3
+        assert list(forwarder.count_method([1, 2])) == [2] * 3
+        assert all(x.computed.count("count_method") == 2 for x in forwarder)
+        info = forwarder.cache_info()
+        assert (info.misses, info.currsize) == (6, 6)
+
+    def test_invalidate(self):
+        forwarder = MemoizingForwarderList((FrozenItem() for _ in range(3)), proxy_onto=True)
+        forwarder.cache_clear()
+        forwarder.expensive_property
+        forwarder.pure_method(1)
+        assert forwarder.invalidate("pure_method") == 3
+        assert MemoizingForwarderList(forwarder[:1]).invalidate() == 1
+        assert forwarder.invalidate() == 2
+        forwarder.expensive_property
+        assert all(x.computed.count("expensive_property") == 2 for x in forwarder)
+
+    def test_memoize_selected_attributes(self):
+        forwarder = FrozenItemForwarderList(FrozenItem() for _ in range(6))
+        assert type(forwarder).__name__ == "FrozenItemForwarderList"
+        forwarder.pure_method(1)
+        forwarder.pure_method(1)
+        assert all(x.computed == ["pure_method"] * 2 for x in forwarder)
+        forwarder.expensive_property
+        info = forwarder.cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (0, 6, 4, 4)
+        # the least recently used results were evicted
+        forwarder.expensive_property
+        assert [x.computed.count("expensive_property") for x in forwarder] == [2] * 6
+        assert forwarder._memo_cache is not MemoizingForwarderList._memo_cache
+
+    def test_memoize_single_name(self):
+        class SingleMemoizingForwarderList(MemoizingForwarderList):
+            MEMOIZE = "expensive_property_"
+
+        assert SingleMemoizingForwarderList.MEMOIZE == frozenset(["expensive_property_"])
+        forwarder = SingleMemoizingForwarderList([FrozenItem()])
+        assert forwarder._memoized("expensive_property_")
+        # no substring matches
+        assert not forwarder._memoized("expensive_property")
+
+
+class TestIncrementalTyping(object):
+    def test_append_widens(self):
+        forwarder = ForwarderList((SubItem(), SubItem()), proxy_onto=True)
+        assert type(forwarder).__name__ == "TypedForwarderListForSubItem"
+        forwarder.append(SubItem2())
+        assert type(forwarder) is type(ForwarderList((Item(), ), proxy_onto=True))
+        typed_cls = type(forwarder)
+        forwarder.insert(0, SubItem())
+        forwarder[1] = Item()
+        assert type(forwarder) is typed_cls
+        forwarder += [NotAnItem()]
+        assert type(forwarder) is ForwarderList
+        assert len(forwarder) == 5
+
+    def test_explicit_proxy_onto_widens(self):
+        forwarder = ForwarderList((SubItem(), ), proxy_onto=SubItem)
+        forwarder.extend(Item() for _ in range(3))
+        assert type(forwarder).__name__ == "TypedForwarderListForItem"
+        assert forwarder.proxy_onto is Item
+        forwarder[1:3] = [NotAnItem()]
+        assert type(forwarder) is ForwarderList
+        assert forwarder.proxy_onto is object
+
+    def test_empty_auto_typed(self):
+        with pytest.warns(UserWarning):
+            forwarder = ForwarderList([], proxy_onto=True)
+        assert type(forwarder) is ForwarderList
+        forwarder.append(SubItem())
+        assert type(forwarder).__name__ == "TypedForwarderListForSubItem"
+        assert hasattr(type(forwarder), "sub_property")
+
+    def test_untyped_and_static_unchanged(self):
+        forwarder = ForwarderList((Item(), ))
+        forwarder.append(Item())
+        assert type(forwarder) is ForwarderList
+        static_forwarder = StaticItemForwarderList((SubItem(), ))
+        static_forwarder.append(NotAnItem())
+        assert type(static_forwarder) is StaticItemForwarderList
+
+    def test_widen_to_static_base(self):
+        forwarder = StaticItemForwarderList((SubItem(), ), proxy_onto=SubItem)
+        assert type(forwarder).__name__ == "TypedStaticItemForwarderListForSubItem"
+        forwarder.append(Item())
+        assert type(forwarder) is StaticItemForwarderList
+
+
+class TestForwarderIndex(object):
+    def test_index_by(self):
+        forwarder = ForwarderList((Item(identifier=ix % 5) for ix in range(20)), proxy_onto=True)
+        index = forwarder.index_by("identifier")
+        assert forwarder.index_by("identifier") is index
+        assert sorted(index.keys()) == list(range(5))
+        selection = index[3]
+        assert type(selection) is type(forwarder)
+        assert selection == [x for x in forwarder if x.identifier == 3]
+        assert 5 not in index
+        assert len(index[5]) == 0
+        assert type(index[5]) is type(forwarder)
+
+    def test_index_extend_self(self):
+        forwarder = ForwarderList([Item(identifier=1), Item(identifier=2)], proxy_onto=True)
+        index = forwarder.index_by("identifier")
+        forwarder.extend(forwarder)
+        assert len(index[1]) == 2
+        forwarder += forwarder
+        assert len(index[1]) == 4
+        assert len(forwarder) == 8
+
+    def test_index_consistent_after_mutation(self):
+        forwarder = ForwarderList((Item(identifier=ix % 5) for ix in range(20)), proxy_onto=True)
+        index = forwarder.index_by("identifier")
+        assert len(index[7]) == 0
+        forwarder.append(Item(identifier=7))
+        forwarder.extend(Item(identifier=7) for _ in range(2))
+        assert len(index[7]) == 3
+        forwarder.pop()
+        assert len(index[7]) == 2
+        forwarder[0] = Item(identifier=7)
+        assert len(index[7]) == 3
+        assert len(index[0]) == 3
+        del forwarder[:]
+        assert len(index) == 0
+
+    def test_ordered_index(self):
+        forwarder = ForwarderList((Item(identifier=ix) for ix in range(20)), proxy_onto=True)
+        with pytest.raises(TypeError):
+            forwarder.index_by("identifier").range(5, 10)
+        index = forwarder.index_by("identifier", ordered=True)
+        assert list(index.range(5, 10).identifier) == list(range(5, 10))
+        assert type(index.range(5, 10)) is type(forwarder)
+        forwarder.reverse()
+        forwarder.append(Item(identifier=7.5))
+        assert list(index.range(7).identifier) == [7, 7.5] + list(range(8, 20))
+        assert list(index.range(stop=2).identifier) == [0, 1]
+
+
+class TestWhere(object):
+    def test_where(self):
+        forwarder = ForwarderList(
+            (Item(nesting_level=ix % 2, identifier=ix / 10.0) for ix in range(10)),
+            proxy_onto=True,
+        )
+        selection = forwarder.where(identifier__gt=0.5, nesting_level=0)
+        assert type(selection) is type(forwarder)
+        assert selection == [x for x in forwarder if x.identifier > 0.5 and x.nesting_level == 0]
+        assert forwarder.where(nesting_level__in=(1, 2)) == forwarder[1::2]
+        assert forwarder.where(identifier__lte=0.2, nesting_level__ne=1) == forwarder[0:3:2]
+        assert forwarder.where() == forwarder
+        assert len(forwarder.where(nesting_level=5)) == 0
+
+    def test_where_dynamic_attribute(self):
+        forwarder = ForwarderList((Item() for _ in range(3)), proxy_onto=True)
+        with pytest.warns(UserWarning):
+            selection = forwarder.where(dynamic_attribute__contains="dynamic")
+        assert selection == forwarder
+        assert ForwarderList(forwarder).where(dynamic_attribute="other") == []
+
+    def test_where_untyped(self):
+        forwarder = ForwarderList((Item(), SubItem(), NotAnItem()))
+        selection = forwarder.where(class_attribute__isnot=None, class_attribute="class_attribute")
+        assert type(selection) is ForwarderList
+        assert selection == forwarder[:2]
+
+
+class CountedKey(object):
+    lookups = 0
+
+    def __init__(self, key):
+        self._key = key
+
+    @property
+    def key(self):
+        CountedKey.lookups += 1
+        return self._key
+
+
+class TestRanking(object):
+    def items(self, keys):
+        return ForwarderList([CountedKey(key) for key in keys], proxy_onto=True)
+
+    def test_sort_by(self):
+        items = self.items([3, 1, 2, 1])
+        CountedKey.lookups = 0
+        ordered = items.sort_by("key")
+        assert CountedKey.lookups == 4
+        assert type(ordered) is type(items)
+        assert ordered == sorted(items, key=lambda x: x._key)
+        assert ordered.key == [1, 1, 2, 3]
+        assert items.sort_by("key", reverse=True).key == [3, 2, 1, 1]
+
+    def test_top_k(self):
+        keys = [random.random() for _ in range(100)]
+        items = self.items(keys)
+        CountedKey.lookups = 0
+        top = items.top_k("key", 5)
+        assert CountedKey.lookups == 100
+        assert type(top) is type(items)
+        assert top == items.sort_by("key", reverse=True)[:5]
+        assert items.top_k("key", 3, largest=False).key == sorted(keys)[:3]
+        assert len(items.top_k("key", 200)) == 100
+        assert items.top_k("key", 0) == []
+        frozen = ForwarderTuple(items, proxy_onto=True)
+        assert type(frozen.top_k("key", 2)) is type(frozen)
+
+    def test_group_by(self):
+        items = self.items([2, 1, 2, 3, 1])
+        CountedKey.lookups = 0
+        groups = items.group_by("key")
+        assert CountedKey.lookups == 5
+        assert list(groups) == [2, 1, 3]
+        assert all(type(group) is type(items) for group in groups.values())
+        assert groups[2] == [items[0], items[2]]
+        assert groups[3].key == [3]
+
+
+class TestShardedForwarderList(object):
+    def test_sharded(self):
+        items = [Item(identifier=ix) for ix in range(10)]
+        with ShardedForwarderList(items, shards=3, proxy_onto=True) as sharded:
+            assert type(sharded).__name__ == "TypedShardedForwarderListForItem"
+            assert hasattr(type(sharded), "recursive")
+            assert len(sharded) == 10
+            assert len(sharded._processes) == 3
+            assert list(sharded.identifier) == list(range(10))
+            assert type(sharded.identifier).__name__ == "TypedForwarderListForint"
+            results = sharded.recursive(bump=2)
+            assert type(results).__name__ == "TypedForwarderListForItem"
+            assert list(results.nesting_level) == [2] * 10
+            # items stay resident in the shards
+            assert list(sharded.nesting_level) == [0] * 10
+            assert sharded.method(1, key="value")[0] == ((1, ), {"key": "value"})
+            assert sharded.gather() == items
+            with pytest.raises(CalledIgnoredAttribute):
+                sharded._forward_()
+            with pytest.raises(AttributeError):
+                sharded.not_an_attribute
+            # shards remain usable after an error
+            assert list(sharded.identifier) == list(range(10))
+        with pytest.raises(RuntimeError):
+            sharded.identifier
+
+    def test_sharded_threads(self):
+        items = [Item(identifier=ix, nesting_level=-ix) for ix in range(6)]
+        errors = []
+
+        def read(attr, expected):
+            for _ in range(50):
+                values = list(getattr(sharded, attr))
+                if values != expected:
+                    errors.append(values)
+
+        with ShardedForwarderList(items, shards=3, proxy_onto=True) as sharded:
+            threads = [
+                threading.Thread(target=read, args=("identifier", list(range(6)))),
+                threading.Thread(target=read, args=("nesting_level", [-ix for ix in range(6)])),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert errors == []
+
+    def test_sharded_untyped(self):
+        sharded = ShardedForwarderList((CallableItem() for _ in range(4)), shards=8)
+        try:
+            assert type(sharded) is ShardedForwarderList
+            assert len(sharded._processes) == 4
+            assert list(sharded(42)) == [42] * 4
+            assert type(sharded(42)) is ForwarderList
+        finally:
+            sharded.close()
+        empty = ShardedForwarderList([])
+        assert empty.identifier == []
+        empty.close()
+
+
+def sum_identifiers(records):
+    return sum(records.identifier), type(records).__name__
+
+
+@pytest.mark.skipif(metaforward.shared_memory is None, reason="requires shared_memory")
+class TestSharedRecordList(object):
+    def test_shared_records(self):
+        items = [Item(nesting_level=ix % 3, identifier=ix / 4.0) for ix in range(10)]
+        with SharedRecordList(items, proxy_onto=True) as shared:
+            assert type(shared).__name__ == "TypedSharedRecordListForItem"
+            assert len(shared) == 10
+            assert list(shared.identifier) == [x.identifier for x in items]
+            assert type(shared.nesting_level).__name__ == "TypedForwarderListForint"
+            # only stored fields are forwarded
+            with pytest.raises(AttributeError, match="records()"):
+                shared.instance_property
+            with pytest.raises(AttributeError):
+                shared.recursive()
+            records = shared.records()
+            assert type(records).__name__ == "TypedForwarderListForItem"
+            assert list(records.instance_property) == [x.instance_property for x in items]
+            assert list(records.recursive().nesting_level) == [x.nesting_level + 1 for x in items]
+            assert shared[3] == items[3]
+            assert shared[-1] == items[-1]
+            assert list(shared) == items
+            assert shared[2:4] == items[2:4]
+            assert shared[::-3] == items[::-3]
+            with pytest.raises(IndexError):
+                shared[10]
+            view = shared.column("identifier")
+            assert view.format == "d"
+            assert view[4] == 1.0
+            view.release()
+
+    def test_attach_in_worker(self):
+        items = [Item(identifier=ix) for ix in range(100)]
+        with SharedRecordList(items, proxy_onto=True) as shared:
+            assert len(pickle.dumps(shared)) < 1000
+            pool = multiprocessing.Pool(2)
+            try:
+                results = pool.map(sum_identifiers, [shared] * 4)
+            finally:
+                pool.close()
+                pool.join()
+        assert results == [(sum(range(100)), "TypedSharedRecordListForItem")] * 4
+
+    def test_unsupported_records(self):
+        with pytest.raises(TypeError):
+            SharedRecordList([NotAnItem()])
+        with pytest.raises(TypeError):
+            SharedRecordList([FrozenItem()])
+        with pytest.raises(TypeError):
+            SharedRecordList([Item(), SubItem()])
+        with pytest.raises(TypeError):
+            SharedRecordList([Item(identifier="not a number")])
+        with pytest.raises(TypeError):
+            SharedRecordList([Item(identifier=2 ** 63)])
+
+    def test_unpackable_records_unlinked(self, monkeypatch):
+        blocks = []
+        create = metaforward.shared_memory.SharedMemory
+
+        def record_block(*args, **kwargs):
+            blocks.append(create(*args, **kwargs))
+            return blocks[-1]
+
+        monkeypatch.setattr(metaforward.shared_memory, "SharedMemory", record_block)
+        with pytest.raises(TypeError):
+            SharedRecordList([Item(nesting_level=1000)], formats={"nesting_level": "b"})
+        assert len(blocks) == 1
+        with pytest.raises(FileNotFoundError):
+            create(name=blocks[0].name)
+
+
+class TestPickle(object):
+    @pytest.mark.parametrize("proxy_onto", [None, Item, True])
+    def test_pickle_forwarder_list(self, proxy_onto):
+        forwarder = ForwarderList((Item() for _ in range(10)), proxy_onto=proxy_onto)
+        unpickled = pickle.loads(pickle.dumps(forwarder))
+        assert type(unpickled) is type(forwarder)
+        assert unpickled == forwarder
+        assert unpickled.proxy_onto == forwarder.proxy_onto
+        assert list(unpickled.recursive().nesting_level) == [1] * 10
+
+    def test_pickle_typed_class(self):
+        typed_cls = type(ForwarderList((SubItem(), ), proxy_onto=True))
+        assert pickle.loads(pickle.dumps(typed_cls)) is typed_cls
+        assert pickle.loads(pickle.dumps(StaticItemForwarderList)) is StaticItemForwarderList
+        static_forwarder = StaticItemForwarderList((Item(), ))
+        assert type(pickle.loads(pickle.dumps(static_forwarder))) is StaticItemForwarderList
+
+    def test_pickle_state(self):
+        forwarder = ForwarderList((SubItem(), ), proxy_onto=SubItem)
+        forwarder.index_by("identifier")
+        forwarder.append(Item())
+        unpickled = pickle.loads(pickle.dumps(forwarder))
+        assert type(unpickled).__name__ == "TypedForwarderListForItem"
+        assert unpickled.proxy_onto is Item
+        assert "_forward_indexes" not in unpickled.__dict__
+        scatter = pickle.loads(pickle.dumps(ForwarderList((CallableItem() for _ in range(3))).scatter))
+        assert list(scatter((1, 2, 3))) == [1, 2, 3]
+
+    @pytest.mark.parametrize("item_type", [SlotsItem, StatefulItem])
+    def test_pickle_items_with_setstate(self, item_type):
+        forwarder = ForwarderList([item_type(1), item_type(2)], proxy_onto=True)
+        for copied in (pickle.loads(pickle.dumps(forwarder)), copy.copy(forwarder)):
+            assert copied.proxy_onto is True
+            assert list(copied.identifier) == [1, 2]
+            assert all("proxy_onto" not in getattr(x, "__dict__", {}) for x in copied)
+        flat = ForwarderList([Parent([item_type(1)]), Parent()]).flatten("children")
+        unpickled = pickle.loads(pickle.dumps(flat))
+        assert unpickled.offsets == flat.offsets
+        assert unpickled.identifier.regroup() == [[1], []]
+        frozen = ForwarderTuple([item_type(1)], proxy_onto=True)
+        assert pickle.loads(pickle.dumps(frozen)).identifier == (1, )
+
+    def test_pickle_compact(self):
+        forwarders = [ForwarderList((ix, ix + 1), proxy_onto=True) for ix in range(100)]
+        untyped = [ForwarderList((ix, ix + 1)) for ix in range(100)]
+        assert type(forwarders[0]).__name__ == "TypedForwarderListForint"
+        # the typed class is only pickled once per stream
+        pickled = pickle.dumps(forwarders)
+        assert pickled.count(b"typed_forwarder_cls") == 1
+        assert len(pickled) - len(pickle.dumps(untyped)) < 1000
+
+
+class TestForwarder(object):
+    def test_direct_delegation(self):
+        item = Item()
+        forwarder = ItemForwarder(item)
+        assert forwarder.nesting_level == 0
+        assert forwarder.instance_property == item.instance_property
+        assert forwarder.class_attribute == Item.class_attribute
+        assert forwarder.recursive(bump=2).nesting_level == 2
+        # methods are bound once, then found in the instance dict
+        assert forwarder.__dict__["recursive"] == item.recursive
+        assert forwarder.method(1, a=2) == ((1, ), {"a": 2})
+        assert forwarder._forward_ == item._forward
+        with pytest.warns(UserWarning):
+            assert forwarder.dynamic_attribute == "dynamic_attribute"
+        item.nesting_level = 5
+        assert forwarder.nesting_level == 5
+
+    def test_retarget(self):
+        forwarder = ItemForwarder(Item(identifier=1))
+        assert forwarder.recursive().identifier == 1
+        forwarder.other = "kept"
+        forwarder._forward_target = Item(identifier=2)
+        assert "recursive" not in forwarder.__dict__
+        assert forwarder.other == "kept"
+        assert forwarder.recursive().identifier == 2
+        assert forwarder.identifier == 2
+
+    def test_custom_setattr(self):
+        class LoggingItemForwarder(Forwarder):
+            PROXY_ONTO = Item
+
+            def __setattr__(self, attr, value):
+                self.__dict__.setdefault("assigned", []).append(attr)
+                super(LoggingItemForwarder, self).__setattr__(attr, value)
+
+        forwarder = LoggingItemForwarder(Item(identifier=1))
+        assert forwarder.recursive().identifier == 1
+        forwarder._forward_target = Item(identifier=2)
+        assert forwarder.assigned == ["_forward_target", "_forward_target"]
+        assert forwarder.recursive().identifier == 2
+
+    def test_direct_delegation_introspection(self):
+        assert inspect.signature(ItemForwarder.recursive) == inspect.signature(Item.recursive)
+        assert isinstance(ItemForwarder.__dict__["recursive"], BoundOnceMethod)
+        assert isinstance(ItemForwarder.__dict__["nesting_level"], property)
+
+    def test_overridden_forward(self):
+        forwarder = ForwardingItemForwarder(Item())
+        assert not isinstance(ForwardingItemForwarder.__dict__["recursive"], BoundOnceMethod)
+        assert forwarder.recursive(bump=2).nesting_level == 2
+        assert "recursive" not in forwarder.__dict__
+
+
+class Resource(object):
+    def __init__(self, name, fail_enter=False, suppress=False):
+        self.name = name
+        self.fail_enter = fail_enter
+        self.suppress = suppress
+        self.entered = False
+        self.exit_args = None
+
+    def __enter__(self):
+        if self.fail_enter:
+            raise ValueError(self.name)
+        self.entered = True
+        return self.name
+
+    def __exit__(self, etype, evalue, traceback):
+        self.exit_args = (etype, evalue)
+        return self.suppress
+
+
+class TestContextManager(object):
+    def test_forwarder(self):
+        resource = Resource("a")
+        with Forwarder(resource) as name:
+            assert name == "a"
+        assert resource.entered
+        assert resource.exit_args == (None, None)
+
+    def test_concurrent(self):
+        resources = ForwarderList([Resource(ix) for ix in range(20)])
+        with resources.concurrent_context(max_workers=4) as names:
+            assert isinstance(names, ForwarderList)
+            assert names == list(range(20))
+            assert all(resources.entered)
+        assert resources.exit_args == [(None, None)] * 20
+
+    def test_concurrent_enter_failure(self):
+        resources = ForwarderList([Resource(ix, fail_enter=ix == 3) for ix in range(8)])
+        with pytest.raises(ValueError):
+            with resources.concurrent_context():
+                assert False, "body should not run"
+        for resource in resources:
+            if resource.name == 3:
+                assert resource.exit_args is None
+            else:
+                assert resource.exit_args[0] is ValueError
+
+    def test_concurrent_suppress(self):
+        resources = ForwarderList([Resource("a"), Resource("b", suppress=True)])
+        with resources.concurrent_context():
+            raise KeyError("suppressed")
+        assert [args[0] for args in resources.exit_args] == [KeyError, KeyError]
+        with pytest.raises(KeyError):
+            with ForwarderList([Resource("a")]).concurrent_context():
+                raise KeyError("raised")
+
+
+class TestSpecialization(object):
+    def test_specialize_dynamic_attribute(self):
+        forwarder = SpecializingItemForwarderList(Item() for _ in range(3))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                assert "dynamic_attribute" not in type(forwarder).__dict__
+                assert list(forwarder.dynamic_attribute) == ["dynamic_attribute"] * 3
+            assert "dynamic_attribute" in type(forwarder).__dict__
+            assert list(forwarder.dynamic_attribute) == ["dynamic_attribute"] * 3
+            assert list(forwarder.dynamic_token) == [x.dynamic_token for x in forwarder]
+        # warned once per attribute
+        assert [str(w.message).split()[0] for w in caught] == ["'dynamic_attribute'", "'dynamic_token'"]
+        assert "dynamic_attribute" not in SubclassItemForwarderList.__dict__
+        assert "dynamic_attribute" not in StaticItemForwarderList.__dict__
+
+    def test_specialize_direct(self):
+        with pytest.warns(UserWarning):
+            for _ in range(2):
+                assert SpecializingItemForwarder(Item()).dynamic_attribute == "dynamic_attribute"
+        assert isinstance(SpecializingItemForwarder.__dict__["dynamic_attribute"], property)
+        assert SpecializingItemForwarder(Item()).dynamic_attribute == "dynamic_attribute"
+        with pytest.raises(AttributeError):
+            SpecializingItemForwarder(NotAnItem()).dynamic_attribute
+
+    def test_assign_specialized_attribute(self):
+        with pytest.warns(UserWarning):
+            for _ in range(2):
+                SpecializingItemForwarder(Item()).dynamic_token
+        forwarder = SpecializingItemForwarder(Item())
+        forwarder.dynamic_token = 5
+        assert forwarder.dynamic_token == 5
+        del forwarder.dynamic_token
+        assert forwarder.dynamic_token == forwarder._forward_target.dynamic_token
+        with pytest.raises(AttributeError):
+            del forwarder.dynamic_token
+
+    def test_specialize_per_class(self):
+        class ParentSpecializingList(ForwarderList):
+            PROXY_ONTO = Item
+            SPECIALIZE_THRESHOLD = 3
+
+        class ChildSpecializingList(ParentSpecializingList):
+            pass
+
+        with pytest.warns(UserWarning):
+            for _ in range(2):
+                ParentSpecializingList([Item()]).dynamic_token
+            for _ in range(2):
+                ChildSpecializingList([Item()]).dynamic_token
+        # lookups on the subclass don't count towards the parent class threshold
+        assert "dynamic_token" not in ParentSpecializingList.__dict__
+        assert "dynamic_token" not in ChildSpecializingList.__dict__
+        ChildSpecializingList([Item()]).dynamic_token
+        assert "dynamic_token" in ChildSpecializingList.__dict__
+
+    def test_missing_attribute_not_specialized(self):
+        forwarder = SpecializingItemForwarderList([Item()])
+        for _ in range(5):
+            with pytest.raises(AttributeError):
+                forwarder.not_an_attribute
+        assert "not_an_attribute" not in type(forwarder).__dict__
+
+
+class TestForwarderTables(object):
+    def test_introspect_once(self, monkeypatch):
+        class Proxied(object):
+            attribute = "attribute"
+
+            def method(self, arg):
+                return arg
+
+        calls = []
+        signature = metaforward.method_signature_and_defaults
+        monkeypatch.setattr(
+            metaforward,
+            "method_signature_and_defaults",
+            lambda method: calls.append(method) or signature(method),
+        )
+
+        class StaticProxiedForwarderList(ForwarderList):
+            PROXY_ONTO = Proxied
+
+        class StaticProxiedForwarder(Forwarder):
+            PROXY_ONTO = Proxied
+
+        for forwarder_cls in (ForwarderList, ReducingForwarderList, MemoizingForwarderList):
+            forwarder = forwarder_cls([Proxied(), Proxied()], proxy_onto=True)
+            assert list(forwarder.method(1)) == [1, 1]
+        ShardedForwarderList._typed_forwarder_cls(Proxied)
+        assert list(StaticProxiedForwarderList([Proxied()]).attribute) == ["attribute"]
+        assert StaticProxiedForwarder(Proxied()).method(2) == 2
+        assert len(calls) == 1
+
+    def test_no_aliases_for_unshadowed_attributes(self):
+        typed_cls = type(ForwarderList([Item()], proxy_onto=True))
+        assert hasattr(typed_cls, "_forward_")
+        assert not hasattr(typed_cls, "nesting_level_")
+
+
+class Worker(object):
+    def __init__(self, value):
+        self.value = value
+
+    def cheap(self):
+        return self.value
+
+    def sleepy(self):
+        time.sleep(0.005)
+        return self.value
+
+    def busy(self):
+        total = 0
+        for ix in range(50000):
+            total += ix
+        return self.value
+
+
+class TestExecutionPlanner(object):
+    def workers(self):
+        return ForwarderList([Worker(ix) for ix in range(8)], proxy_onto=True)
+
+    def test_plans(self):
+        with ExecutionPlanner(max_workers=4) as planner:
+            workers = self.workers().adaptive(planner)
+            for _ in range(3):
+                for method in ("cheap", "sleepy", "busy"):
+                    results = getattr(workers, method)()
+                    assert type(results).__name__ == "TypedForwarderListForint"
+                    assert results == list(range(8))
+            plans = planner.plans
+            assert plans["Worker.cheap"].strategy == metaforward.SERIAL
+            assert plans["Worker.sleepy"].strategy == metaforward.THREAD
+            assert plans["Worker.sleepy"].workers == 4
+            assert plans["Worker.busy"].strategy == metaforward.SERIAL
+            stats = planner.stats
+            assert stats["Worker.sleepy"].calls == 3
+            assert stats["Worker.sleepy"].items == 24
+            assert stats["Worker.sleepy"].releases_gil
+            assert stats["Worker.sleepy"].item_cpu < stats["Worker.sleepy"].item_wall
+            assert not stats["Worker.busy"].releases_gil
+            assert stats["Worker.cheap"].releases_gil is None
+
+    def test_processes(self):
+        planner = ExecutionPlanner(
+            max_workers=2, processes=True, min_item_time=0, process_item_time=0,
+            min_speedup=float("inf"),
+        )
+        with planner:
+            workers = self.workers().adaptive(planner)
+            for _ in range(3):
+                assert workers.busy() == list(range(8))
+            assert planner.plans["Worker.busy"].strategy == metaforward.PROCESS
+            assert planner.plans["Worker.busy"].chunksize >= 1
+            # an item that can't be pickled falls back to serial dispatch
+            workers.append(Worker(threading.Lock()))
+            assert workers.busy()[-1] is workers[-1].value
+
+    def test_shared_planner(self):
+        workers = self.workers()
+        adaptive = workers.adaptive()
+        assert "_forward_method" not in workers.__dict__
+        assert adaptive.__dict__["_forward_method"].func.__self__ is ExecutionPlanner.shared()
+        assert adaptive.cheap() == list(range(8))
+
+
+class TestForwarderRegistry(object):
+    def test_generate_once_across_threads(self, monkeypatch):
+        class Fresh(object):
+            attribute = "attribute"
+
+        calls = []
+        generate = TypedForwarderListMeta._generate_typed_forwarder
+
+        def slow_generate(mcs, forwarder_cls, proxy_onto_type):
+            calls.append(proxy_onto_type)
+            time.sleep(0.05)
+            return generate(forwarder_cls, proxy_onto_type)
+
+        monkeypatch.setattr(
+            TypedForwarderListMeta, "_generate_typed_forwarder", classmethod(slow_generate),
+        )
+        n_threads = 16
+        barrier = threading.Barrier(n_threads)
+        classes = []
+
+        def construct():
+            barrier.wait()
+            classes.append(type(ForwarderList([Fresh()], proxy_onto=True)))
+
+        threads = [threading.Thread(target=construct) for _ in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(classes) == n_threads
+        assert len(set(classes)) == 1
+        assert calls == [Fresh]
+
+    def test_same_name_different_types(self):
+        def make_type():
+            class Clash(object):
+                pass
+            return Clash
+
+        first, second = make_type(), make_type()
+        first_cls = type(ForwarderList([first()], proxy_onto=True))
+        second_cls = type(ForwarderList([second()], proxy_onto=True))
+        assert first_cls is not second_cls
+        assert first_cls.PROXY_ONTO is first
+        assert second_cls.PROXY_ONTO is second
+
+
+class TestRaggedForwarderList(object):
+    @staticmethod
+    def parents():
+        return ForwarderList(
+            (Parent([Item(identifier=ix * 10 + jx) for jx in range(ix)]) for ix in range(4)),
+            proxy_onto=True,
+        )
+
+    def test_item_offsets_attribute(self):
+        parents = ForwarderList(
+            [Parent([Segment(1), Segment(2)]), Parent([Segment(3)])], proxy_onto=True,
+        )
+        flat = parents.flatten("children")
+        assert type(flat).__name__ == "TypedRaggedForwarderListForSegment"
+        assert flat.offsets == ((0, 2, 3), )
+        assert list(flat.offsets_) == [1, 2, 3]
+        assert flat.offsets_.regroup() == [[1, 2], [3]]
+
+    def test_mutation_invalidates_offsets(self):
+        flat = self.parents().flatten("children")
+        flat.append(Item(identifier=99))
+        assert flat.offsets is None
+        with pytest.raises(ValueError):
+            flat.regroup()
+        with pytest.raises(ValueError):
+            flat.identifier.regroup()
+
+    def test_scatter_keeps_offsets(self):
+        flat = ForwarderList(
+            [Parent([Segment(1), Segment(2)]), Parent([Segment(3)])],
+        ).flatten("children")
+        assert flat.scatter.offsets == flat.offsets
+        assert flat.scatter.shift([10, 20, 30]).regroup() == [[11, 22], [33]]
+        assert flat.adaptive().shift(1).regroup() == [[2, 3], [4]]
+
+    def test_flatten(self):
+        flat = self.parents().flatten("children")
+        assert type(flat).__name__ == "TypedRaggedForwarderListForItem"
+        assert flat.offsets == ((0, 0, 1, 3, 6), )
+        identifiers = flat.identifier
+        assert type(identifiers).__name__ == "TypedRaggedForwarderListForint"
+        assert list(identifiers) == [10, 20, 21, 30, 31, 32]
+        assert identifiers.offsets == flat.offsets
+        groups = identifiers.regroup()
+        assert type(groups).__name__ == "TypedForwarderListForTypedForwarderListForint"
+        assert [type(g).__name__ for g in groups] == ["TypedForwarderListForint"] * 4
+        assert groups == [[], [10], [20, 21], [30, 31, 32]]
+        recursed = flat.recursive(bump=2)
+        assert recursed.offsets == flat.offsets
+        assert recursed.nesting_level.regroup() == [[], [2], [2, 2], [2, 2, 2]]
+
+    def test_flatten_nested(self):
+        grandparents = ForwarderList(
+            [Parent([Parent([Item(identifier=1)]), Parent()]), Parent(), Parent([Parent([Item(identifier=2)] * 2)])],
+        )
+        flat = grandparents.flatten("children").flatten("children")
+        assert type(flat) is RaggedForwarderList
+        assert flat.offsets == ((0, 2, 2, 3), (0, 1, 1, 3))
+        assert flat.identifier.regroup() == [[[1], []], [], [[2, 2]]]
+
+    def test_flatten_empty(self):
+        with pytest.warns(UserWarning):
+            flat = ForwarderList([Parent(), Parent()], proxy_onto=True).flatten("children")
+        assert len(flat) == 0
+        assert flat.identifier.regroup() == [[], []]
+
+    def test_selection(self):
+        flat = self.parents().flatten("children")
+        assert type(flat.where(identifier__gt=20)).__name__ == "TypedForwarderListForItem"
+        assert type(flat[1:]).__name__ == "TypedForwarderListForItem"
+        unpickled = pickle.loads(pickle.dumps(flat))
+        assert unpickled.offsets == flat.offsets